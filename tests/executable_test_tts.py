@@ -1,4 +1,7 @@
+import hashlib
+import json
 import os
+import shutil
 
 # import tempfile # No longer needed
 from dotenv import load_dotenv
@@ -7,6 +10,7 @@ from transcript_to_audio.text_to_speech import TextToSpeech
 from transcript_to_audio.schemas import TTSConfig, SpeakerConfig
 
 import logging
+from typing import Optional, Sequence
 
 logger = logging.getLogger("transcript_to_audio_logger")
 logger.setLevel(logging.DEBUG)
@@ -22,33 +26,114 @@ stream_handler.setFormatter(formatter)
 # Add the handler to the logger
 logger.addHandler(stream_handler)
 
+SAMPLE_TRANSCRIPT = "tests/transcripts/sample_transcript_en.txt"
+
+# Environment variables each provider needs before a test run makes sense
+REQUIRED_ENVS = {
+    "elevenlabs": ("ELEVENLABS_API_KEY",),
+    "azureopenai": (
+        "AZURE_OPENAI_API_KEY",
+        "AZURE_OPENAI_ENDPOINT",
+        "AZURE_OPENAI_DEPLOYMENT_NAME",
+    ),
+    "openai": ("OPENAI_API_KEY",),
+    "gemini": ("GOOGLE_API_KEY",),
+    "geminimulti": ("GOOGLE_API_KEY",),
+    # Edge TTS does not require specific env vars
+}
+
+
+class CachingTTS:
+    """
+    Wraps a TextToSpeech instance and reuses output from earlier runs.
+
+    Results are stored in cache_dir keyed by provider, pruned TTS config,
+    speaker configs and transcript text, so repeated runs skip the API calls.
+    """
+
+    def __init__(self, inner: TextToSpeech, provider: str, cache_dir: str):
+        self.inner = inner
+        self.provider = provider
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _cache_key(self, text: str, speaker_configs: dict) -> str:
+        payload = json.dumps(
+            [
+                self.provider,
+                self.inner.tts_config.prune(),
+                {key: config.model_dump() for key, config in speaker_configs.items()},
+                text,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def convert_to_speech(
+        self, text: str, speaker_configs: dict, output_file: str
+    ) -> None:
+        key = self._cache_key(text, speaker_configs)
+        cached_audio = os.path.join(self.cache_dir, f"{key}.{self.inner.audio_format}")
+        cached_transcript = os.path.join(self.cache_dir, f"{key}_transcript.txt")
+        transcript_file = f"{os.path.splitext(output_file)[0]}_transcript.txt"
+
+        if os.path.exists(cached_audio) and os.path.exists(cached_transcript):
+            logger.debug(f"Cache hit for {self.provider}: {key}")
+            shutil.copyfile(cached_audio, output_file)
+            shutil.copyfile(cached_transcript, transcript_file)
+            return
+
+        self.inner.convert_to_speech(text, speaker_configs, output_file, True)
+        shutil.copyfile(output_file, cached_audio)
+        shutil.copyfile(transcript_file, cached_transcript)
+
 
 class ExecutableTestTTS:
     def __init__(
-        self, transcript_filename="tests/transcripts/sample_transcript_en.txt"
+        self,
+        transcript_filename=SAMPLE_TRANSCRIPT,
+        *,
+        text: Optional[str] = None,
+        providers: Sequence[str] = ("elevenlabs",),
+        use_emote: bool = True,
     ):
         # Load environment variables from .env file
         load_dotenv()
 
         # transcript_filename = "tests/transcripts/article_transcript_fi.txt"
 
-        # Load transcript from file
-        try:
-            with open(transcript_filename, "r", encoding="utf-8") as f:
-                self.transcript_text = f.read()
-        except FileNotFoundError:
-            logger.debug(f"Error: Transcript file not found at {transcript_filename}")
-            self.transcript_text = ""  # Set to empty string or handle error as needed
-
-        # Supported providers
-        self.providers = [
-            "elevenlabs",
-            # "azureopenai",
-            # "openai",
-            # "edge",
-            # "geminimulti",
-            # "gemini",
-        ]
+        if text is not None:
+            self.transcript_text = text
+        else:
+            # Load transcript from file
+            try:
+                with open(transcript_filename, "r", encoding="utf-8") as f:
+                    self.transcript_text = f.read()
+            except FileNotFoundError:
+                logger.debug(
+                    f"Error: Transcript file not found at {transcript_filename}"
+                )
+                # Set to empty string or handle error as needed
+                self.transcript_text = ""
+
+        # Supported providers: "elevenlabs", "azureopenai", "openai", "edge",
+        # "geminimulti", "gemini"
+        self.providers = list(providers)
+        self.use_emote = use_emote
+
+        # Set TTS_TEST_CACHE_DIR to an empty string to disable the output cache
+        self.cache_dir = os.getenv("TTS_TEST_CACHE_DIR", "data/cache")
+
+        # Skip providers without credentials before building any configs
+        self.available_providers = [p for p in self.providers if self._has_creds(p)]
+        for provider in self.providers:
+            if provider not in self.available_providers:
+                logger.debug(f"Skipping test for {provider}: Missing API key")
+
+    @staticmethod
+    def _has_creds(provider: str) -> bool:
+        return all(os.getenv(key) for key in REQUIRED_ENVS.get(provider, ()))
 
     def run_tests(self):
         # Define the output directory relative to the project root
@@ -57,7 +142,7 @@ class ExecutableTestTTS:
         os.makedirs(output_dir, exist_ok=True)
         logger.debug(f"Saving test outputs to: {os.path.abspath(output_dir)}")
 
-        for provider in self.providers:
+        for provider in self.available_providers:
             try:
                 logger.debug(f"Testing provider: {provider}")
 
@@ -68,6 +153,11 @@ class ExecutableTestTTS:
                         "ELEVENLABS_API_KEY"
                     )
                     # provider_specific_config_args["model"] = "eleven_flash_v2_5"
+                    # Test-only: request a low-bitrate MP3 tier to cut transfer size.
+                    # Only mp3_* tiers work here since the merge step decodes as mp3.
+                    provider_specific_config_args["output_format"] = os.getenv(
+                        "TTS_OUTPUT_FORMAT", "mp3_22050_32"
+                    )
 
                 elif provider == "azureopenai":
                     provider_specific_config_args["api_key"] = os.getenv(
@@ -89,14 +179,6 @@ class ExecutableTestTTS:
                     )
                 # Edge TTS does not require specific env vars in config
 
-                # Check if api_key is available
-                if (
-                    "api_key" in provider_specific_config_args
-                    and not provider_specific_config_args["api_key"]
-                ):
-                    logger.debug(f"Skipping test for {provider}: Missing API key")
-                    continue
-
                 # Define provider-specific speaker configurations
                 speaker1_config = None
                 speaker2_config = None
@@ -104,7 +186,7 @@ class ExecutableTestTTS:
                 if provider == "elevenlabs":
                     provider_specific_config_args["language"] = "en"
                     emote_config = {
-                        "use_emote": True,
+                        "use_emote": self.use_emote,
                         "emote_merge_pause": 600,
                         # works better for FI
                     }
@@ -188,12 +270,19 @@ class ExecutableTestTTS:
                 output_file = os.path.join(output_dir, f"{provider}_output.mp3")
 
                 # Convert text to speech
-                tts.convert_to_speech(
-                    self.transcript_text,
-                    {1: speaker1_config, 2: speaker2_config},
-                    output_file,
-                    True,
-                )
+                if self.cache_dir:
+                    CachingTTS(tts, provider, self.cache_dir).convert_to_speech(
+                        self.transcript_text,
+                        {1: speaker1_config, 2: speaker2_config},
+                        output_file,
+                    )
+                else:
+                    tts.convert_to_speech(
+                        self.transcript_text,
+                        {1: speaker1_config, 2: speaker2_config},
+                        output_file,
+                        True,
+                    )
 
                 # Verify the file was created
                 if os.path.exists(output_file):
@@ -207,6 +296,22 @@ class ExecutableTestTTS:
                 logger.debug(f"Error testing provider {provider}: {e}")
 
 
+def run_sample_text(providers: Sequence[str] = ("elevenlabs",)):
+    """Run the sample transcript with emotes disabled."""
+    ExecutableTestTTS(providers=providers, use_emote=False).run_tests()
+
+
+def run_sample_with_emoting(providers: Sequence[str] = ("elevenlabs",)):
+    """Run the sample transcript with emotes enabled."""
+    ExecutableTestTTS(providers=providers, use_emote=True).run_tests()
+
+
+def run_transcript_file(
+    transcript_filename: str, providers: Sequence[str] = ("elevenlabs",)
+):
+    """Run an arbitrary transcript file."""
+    ExecutableTestTTS(transcript_filename, providers=providers).run_tests()
+
+
 if __name__ == "__main__":
-    tester = ExecutableTestTTS()
-    tester.run_tests()
+    run_sample_with_emoting()
@@ -0,0 +1,100 @@
+"""Offline tests for the ElevenLabs provider, run against a fake SDK client."""
+
+from types import SimpleNamespace
+
+import pytest
+from elevenlabs.core import ApiError
+
+from transcript_to_audio.schemas import SpeakerConfig, TTSConfig
+from transcript_to_audio.tts.providers import elevenlabs
+from transcript_to_audio.tts.providers.elevenlabs import ElevenLabsTTS
+
+
+class FakeClient:
+    """Stands in for the SDK client, failing the first conversions given."""
+
+    def __init__(self, voice_ids, errors=()):
+        # Each voice library fetch returns the next ID for the voice "Narrator"
+        self.voice_ids = list(voice_ids)
+        self.errors = list(errors)
+        self.voice_fetches = 0
+        self.converted_voice_ids = []
+        self.text_to_speech = SimpleNamespace(convert_as_stream=self.convert)
+        self.voices = SimpleNamespace(get_all=self.get_voices)
+        self.history = SimpleNamespace(get_all=self.get_history)
+        self.generated = []
+
+    def get_voices(self, show_legacy):
+        voice_id = self.voice_ids[min(self.voice_fetches, len(self.voice_ids) - 1)]
+        self.voice_fetches += 1
+        voice = SimpleNamespace(name="Narrator", voice_id=voice_id, labels={})
+        return SimpleNamespace(voices=[voice])
+
+    def get_history(self, page_size):
+        items = [
+            SimpleNamespace(request_id=f"request{i}", text=text)
+            for i, text in enumerate(self.generated)
+        ]
+        return SimpleNamespace(history=items[::-1][:page_size])
+
+    def convert(self, voice_id, text, **kwargs):
+        self.converted_voice_ids.append(voice_id)
+        error = self.errors.pop(0) if self.errors else None
+
+        # The SDK call is lazy, so errors surface while the chunks are read
+        def chunks():
+            if error is not None:
+                raise error
+            self.generated.append(text)
+            yield b"audio"
+
+        return chunks()
+
+
+def generate(client):
+    provider = ElevenLabsTTS(TTSConfig(api_key="test", concurrency=1))
+    provider.client = client
+    segments = provider.split_qa(
+        "<person1>Hello there.</person1>", {1: SpeakerConfig(voice="Narrator")}, []
+    )
+    return provider.generate_audio(segments)
+
+
+def test_stale_voice_id_is_refreshed_once():
+    client = FakeClient(
+        ["old_voice_id", "new_voice_id"],
+        [ApiError(status_code=404, body="voice_not_found")],
+    )
+    segments = generate(client)
+    assert segments[0].audio == b"audio"
+    assert client.voice_fetches == 2
+    assert client.converted_voice_ids == ["old_voice_id", "new_voice_id"]
+
+
+def test_missing_voice_is_not_retried_without_a_new_id():
+    client = FakeClient(
+        ["voice_id"], [ApiError(status_code=404, body="voice_not_found")] * 3
+    )
+    with pytest.raises(ValueError):
+        generate(client)
+    assert client.voice_fetches == 2
+    assert client.converted_voice_ids == ["voice_id"]
+
+
+def test_rate_limited_requests_retry_past_the_error_budget(monkeypatch):
+    delays = []
+    monkeypatch.setattr(elevenlabs.time, "sleep", delays.append)
+    client = FakeClient(
+        ["voice_id"],
+        [ApiError(status_code=429, body="too_many_concurrent_requests")] * 4,
+    )
+    segments = generate(client)
+    assert segments[0].audio == b"audio"
+    assert len(client.converted_voice_ids) == 5
+    assert len(delays) == 4
+
+
+def test_default_concurrency():
+    assert ElevenLabsTTS(TTSConfig(api_key="test"))._concurrency() == 2
+    config = TTSConfig(api_key="test", concurrency=6)
+    assert ElevenLabsTTS(config)._concurrency() == 6
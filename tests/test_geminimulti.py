@@ -0,0 +1,239 @@
+"""Offline tests for the pure helpers of the GeminiMultiTTS provider."""
+
+import random
+import re
+
+import pytest
+
+from transcript_to_audio.schemas import SpeakerSegment, TTSConfig
+from transcript_to_audio.tts.providers.geminimulti import (
+    GeminiMultiTTS,
+    _concat_mp3_frames,
+    _mp3_frame_info,
+    _mp3_frames,
+)
+
+# MPEG-1 Layer III frame headers, 128 kbps, no padding
+HEADER_44100_STEREO = b"\xff\xfb\x90\x44"
+HEADER_44100_MONO = b"\xff\xfb\x90\xc4"
+HEADER_48000_STEREO = b"\xff\xfb\x94\x44"
+
+
+def make_frame(header: bytes, fill: int) -> bytes:
+    """Build one frame of the length its header describes."""
+    _, frame_length = _mp3_frame_info(header)
+    return header + bytes([fill]) * (frame_length - len(header))
+
+
+def make_xing_frame(header: bytes) -> bytes:
+    """Build a Xing/Info header frame like encoders write at the start."""
+    _, frame_length = _mp3_frame_info(header)
+    frame = header + b"\x00" * 32 + b"Xing"
+    return frame + b"\x00" * (frame_length - len(frame))
+
+
+def make_id3v2(payload: bytes, footer: bool = False) -> bytes:
+    """Build an ID3v2 tag with a syncsafe size."""
+    size = len(payload)
+    syncsafe = bytes(
+        [(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F]
+    )
+    flags = b"\x10" if footer else b"\x00"
+    tag = b"ID3\x04\x00" + flags + syncsafe + payload
+    if footer:
+        tag += b"3DI\x04\x00" + flags + syncsafe
+    return tag
+
+
+ID3V1 = b"TAG" + b"t" * 125
+
+
+def test_frame_info():
+    stream_format, frame_length = _mp3_frame_info(HEADER_44100_STEREO)
+    assert stream_format == (3, 0, 1)
+    # 144 * 128000 / 44100
+    assert frame_length == 417
+    _, padded_length = _mp3_frame_info(b"\xff\xfb\x92\x44")
+    assert padded_length == 418
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\xff\xfb",
+        b"RIFF\x00\x00\x00\x00WAVE",
+        b"\xff\xfd\x90\x44",  # Layer II
+        b"\xff\xfb\xf0\x44",  # invalid bitrate index
+        b"\xff\xfb\x9c\x44",  # reserved sample rate
+    ],
+)
+def test_frame_info_rejects_non_layer3(data):
+    assert _mp3_frame_info(data) is None
+
+
+def test_frames_strip_tags_and_xing():
+    frames = make_frame(HEADER_44100_STEREO, 1) + make_frame(HEADER_44100_STEREO, 2)
+    for footer in (False, True):
+        chunk = (
+            make_id3v2(b"payload", footer)
+            + make_xing_frame(HEADER_44100_STEREO)
+            + frames
+            + ID3V1
+        )
+        assert _mp3_frames(chunk) == ((3, 0, 1), frames)
+
+
+def test_concat_joins_frames():
+    first = make_frame(HEADER_44100_STEREO, 1)
+    second = make_frame(HEADER_44100_STEREO, 2)
+    third = make_frame(HEADER_44100_STEREO, 3)
+    chunks = [
+        make_id3v2(b"a") + make_xing_frame(HEADER_44100_STEREO) + first + second,
+        b"",
+        third + ID3V1,
+    ]
+    assert _concat_mp3_frames(chunks) == first + second + third
+
+
+@pytest.mark.parametrize(
+    "other_header", [HEADER_48000_STEREO, HEADER_44100_MONO], ids=["rate", "mode"]
+)
+def test_concat_rejects_mismatched_formats(other_header):
+    chunks = [make_frame(HEADER_44100_STEREO, 1), make_frame(other_header, 2)]
+    assert _concat_mp3_frames(chunks) is None
+
+
+def test_concat_rejects_non_mp3():
+    chunks = [make_frame(HEADER_44100_STEREO, 1), b"RIFF\x00\x00\x00\x00WAVE"]
+    assert _concat_mp3_frames(chunks) is None
+    assert _concat_mp3_frames([b"", b""]) is None
+
+
+# Reference versions of the text splitters before they were optimized; the
+# current implementations must return exactly the same chunks
+
+
+def reference_chunk_text(text, max_bytes):
+    sections = re.split(
+        r"(<Person[12]>.*?</Person[12]>)", text, flags=re.DOTALL | re.IGNORECASE
+    )
+    sections = [s.strip() for s in sections if s.strip()]
+    chunks = []
+    current_chunk = ""
+    for section in sections:
+        tag_match = re.match(
+            r"<(Person[12])>(.*?)</Person[12]>",
+            section,
+            flags=re.DOTALL | re.IGNORECASE,
+        )
+        if tag_match:
+            speaker_tag = tag_match.group(1)
+            content = tag_match.group(2).strip()
+            wrapped = f"<{speaker_tag}>{content}</{speaker_tag}>"
+            test_chunk = current_chunk + wrapped
+            if len(test_chunk.encode("utf-8")) > max_bytes and current_chunk:
+                chunks.append(current_chunk)
+                current_chunk = wrapped
+            else:
+                current_chunk = test_chunk
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def reference_split_turn_text(text, max_chars):
+    if len(text) <= max_chars:
+        return [text]
+    chunks = []
+    sentences = [s for s in re.split(r"([.!?]+(?:\s+|$))", text) if s]
+    current_chunk = ""
+    for i in range(0, len(sentences), 2):
+        separator = sentences[i + 1] if i + 1 < len(sentences) else ""
+        complete_sentence = sentences[i] + separator
+        if len(current_chunk) + len(complete_sentence) > max_chars:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+                current_chunk = complete_sentence
+            else:
+                temp_chunk = ""
+                for word in complete_sentence.split():
+                    if len(temp_chunk) + len(word) + 1 > max_chars:
+                        chunks.append(temp_chunk.strip())
+                        temp_chunk = word
+                    else:
+                        temp_chunk += " " + word if temp_chunk else word
+                current_chunk = temp_chunk
+        else:
+            current_chunk += complete_sentence
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+@pytest.fixture(scope="module")
+def provider():
+    # The gRPC channel connects lazily, so no request is made
+    return GeminiMultiTTS(TTSConfig(api_key="test"))
+
+
+SPLIT_CASES = [
+    "",
+    "...",
+    ". a. b",
+    "a" * 30,
+    "  lead. x!  y?",
+    "word " * 40,
+    ". " * 30,
+    "abc." * 20 + "tail",
+    "x" * 600 + ". yy",
+    "\n\n.!\n" * 50,
+    "First sentence. Second one! A third?  " * 20,
+]
+
+
+@pytest.mark.parametrize("text", SPLIT_CASES)
+@pytest.mark.parametrize("max_chars", [1, 3, 10, 80, 500])
+def test_split_turn_text_matches_reference(provider, text, max_chars):
+    assert provider.split_turn_text(text, max_chars) == reference_split_turn_text(
+        text, max_chars
+    )
+
+
+def test_split_turn_text_matches_reference_fuzzed(provider):
+    rng = random.Random(7)
+    pieces = ["a", "bb", " ", "  ", ".", "!?", "\n", "wörd"]
+    for _ in range(2000):
+        text = "".join(rng.choices(pieces, k=rng.randint(0, 120)))
+        for max_chars in (2, 7, 25):
+            assert provider.split_turn_text(
+                text, max_chars
+            ) == reference_split_turn_text(text, max_chars), (text, max_chars)
+
+
+def test_chunk_text_matches_reference_fuzzed(provider):
+    rng = random.Random(1)
+    words = ["hello", "wörld", "ääkkönen", "日本語", "ok.", "why?", "  ", "\n"]
+    for _ in range(300):
+        text = "".join(
+            f"<{rng.choice(['Person1', 'person2'])}> "
+            + " ".join(rng.choices(words, k=rng.randint(0, 60)))
+            + f" </Person{rng.randint(1, 2)}>"
+            + rng.choice(["", " junk ", "\n"])
+            for _ in range(rng.randint(0, 30))
+        )
+        for max_bytes in (50, 300, 1300):
+            assert provider.chunk_text(text, max_bytes) == reference_chunk_text(
+                text, max_bytes
+            ), (text, max_bytes)
+
+
+def test_batch_segments_packs_by_utf8_bytes(provider):
+    texts = ["ab ", "ääkk", "x" * 12, "", "cd", "efg"]
+    segments = [SpeakerSegment(1, text=text) for text in texts]
+    batches = provider.batch_segments(segments, max_bytes=8)
+    assert [[segment.text for segment in batch] for batch in batches] == [
+        ["ab ", "ääkk"],
+        ["x" * 12],
+        ["", "cd", "efg"],
+    ]
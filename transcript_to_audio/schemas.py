@@ -3,7 +3,7 @@ Pydantic models and data structures for TTS configuration and processing.
 """
 
 from typing import Any, Optional, Dict, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from pydub import AudioSegment
 
 
@@ -120,6 +120,10 @@ class SpeakerConfig(BaseModel):
         extra = "allow"  # Allow extra fields for specific providers.
 
 
+# Built once so a whole speaker config mapping is validated in a single call
+SPEAKER_CONFIGS_ADAPTER = TypeAdapter(Dict[int, SpeakerConfig])
+
+
 class TTSConfig(BaseModel):
     """
     Configuration for the Text-to-Speech system and providers.
@@ -136,6 +140,12 @@ class TTSConfig(BaseModel):
         streaming (Optional[bool]): Whether to use streaming audio generation (OpenAI-specific). Defaults to False.
         speed (Optional[float]): The speaking speed multiplier (OpenAI-specific). Defaults to 1.0.
         language (Optional[str]): The language for the TTS request (OpenAI-specific, distinct from SpeakerConfig language). Defaults to 'en'.
+        output_format (Optional[str]): Provider output format tier, e.g. 'mp3_22050_32' (ElevenLabs-specific). Defaults to None (provider default).
+        concurrency (Optional[int]): Maximum number of synthesis requests a provider runs concurrently. Defaults to None (provider default: 2 for ElevenLabs, 8 otherwise).
+        cache_dir (Optional[str]): Directory for the persistent segment audio cache (ElevenLabs, OpenAI and GeminiMulti). Defaults to None (caching disabled).
+        cache_size_limit (Optional[int]): Maximum total size of the audio cache in bytes. Defaults to 1 GiB.
+        merge_speaker_turns (Optional[bool]): Synthesize consecutive turns of the same speaker in a single request, joined by a short break (ElevenLabs-specific). Defaults to False.
+        sample_rate_hz (Optional[int]): Sample rate of the MP3 audio requested from Google TTS, so all batches share one stream format (GeminiMulti-specific). Defaults to 24000.
     """
 
     audio_format: Optional[str] = Field(
@@ -184,6 +194,30 @@ class TTSConfig(BaseModel):
         default="en",
         description="The language for the TTS request (OpenAI-specific, distinct from SpeakerConfig language).",
     )
+    output_format: Optional[str] = Field(
+        default=None,
+        description="Provider output format tier, e.g. 'mp3_22050_32' (ElevenLabs-specific). None uses the provider default.",
+    )
+    concurrency: Optional[int] = Field(
+        default=None,
+        description="Maximum number of synthesis requests a provider runs concurrently. None uses the provider default: 2 for ElevenLabs, 8 otherwise.",
+    )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the persistent segment audio cache (ElevenLabs, OpenAI and GeminiMulti). None disables caching.",
+    )
+    cache_size_limit: Optional[int] = Field(
+        default=1024**3,
+        description="Maximum total size of the audio cache in bytes; least recently used entries are evicted.",
+    )
+    merge_speaker_turns: Optional[bool] = Field(
+        default=False,
+        description="Synthesize consecutive turns of the same speaker in a single request, joined by a short break (ElevenLabs-specific).",
+    )
+    sample_rate_hz: Optional[int] = Field(
+        default=24000,
+        description="Sample rate of the MP3 audio requested from Google TTS, so all batches share one stream format (GeminiMulti-specific).",
+    )
 
     class Config:
         extra = "allow"  # Allow extra fields for specific providers or future use.
@@ -201,6 +235,7 @@ class TTSConfig(BaseModel):
             "deployment",
             "output_directories",
             "temp_audio_dir",
+            "cache_dir",
         }
         return self.model_dump(exclude=fields_to_exclude)
 
@@ -222,6 +257,20 @@ class SpeakerSegment:
         end_time (Optional[int]): The end time of the segment in milliseconds, if applicable.
     """
 
+    # One instance is created per utterance, so avoid a per-instance __dict__
+    __slots__ = (
+        "speaker_id",
+        "parameters",
+        "text",
+        "voice_config",
+        "audio",
+        "audio_file",
+        "audio_segment",
+        "audio_length",
+        "start_time",
+        "end_time",
+    )
+
     def __init__(
         self,
         speaker_id: int,
@@ -263,28 +312,21 @@ class SpeakerSegment:
         Returns:
             str: An XML-like representation of the SpeakerSegment.
         """
-        # Build parameters part
-        parameters_str = " ".join(
-            f'{key}="{value}"' for key, value in self.parameters.items()
-        )
+        # Build the tag from parts joined once at the end
+        parts = [f"<person{self.speaker_id}"]
+        for key, value in self.parameters.items():
+            parts.append(f' {key}="{value}"')
 
         # Include optional properties if they are set
-        additional_properties = []
         if self.audio_length is not None:
-            additional_properties.append(f'length="{self.audio_length}"')
+            parts.append(f' length="{self.audio_length}"')
         if self.start_time is not None:
-            additional_properties.append(f'start="{self.start_time}"')
+            parts.append(f' start="{self.start_time}"')
         if self.end_time is not None:
-            additional_properties.append(f'end="{self.end_time}"')
-
-        # Combine all parts into the opening tag
-        attributes_str = " ".join(
-            filter(None, [parameters_str] + additional_properties)
-        )
-        opening_tag = f"<person{self.speaker_id} {attributes_str}>".strip()
-
-        # Closing tag
-        closing_tag = f"</person{self.speaker_id}>"
+            parts.append(f' end="{self.end_time}"')
 
-        # Combine everything
-        return f"{opening_tag}{self.text}{closing_tag}"
+        # Close the opening tag, add the text and the closing tag
+        parts.append(">")
+        parts.append(self.text)
+        parts.append(f"</person{self.speaker_id}>")
+        return "".join(parts)
@@ -7,19 +7,20 @@ including cleaning of input text and merging of audio files.
 """
 
 import logging
-import math
 import os
 import tempfile
-from typing import List, Tuple, Optional, Dict, Any, Union
+from io import BytesIO
+from types import MappingProxyType
+from typing import List, Mapping, Tuple, Optional, Dict, Any, Union
 import uuid
+from math import log10
 from pydub import AudioSegment
 from pydub.silence import split_on_silence
 
-from transcript_to_audio.tts.providers.geminimulti import GeminiMultiTTS
-
 from .tts.base import TTSProvider
 from .tts.factory import TTSProviderFactory
 from .schemas import (
+    SPEAKER_CONFIGS_ADAPTER,
     SpeakerSegment,
     SpeakerConfig,
     TTSConfig,
@@ -28,9 +29,31 @@ from .schemas import (
 logger = logging.getLogger("transcript_to_audio_logger")
 
 
-# Default speaker configurations using the Pydantic model
-DEFAULT_SPEAKER_1 = SpeakerConfig()
-DEFAULT_SPEAKER_2 = SpeakerConfig(voice="default_voice_2")
+# Default speaker configurations using the Pydantic model; the values are
+# static so validation is skipped at import time
+DEFAULT_SPEAKER_1 = SpeakerConfig.model_construct()
+DEFAULT_SPEAKER_2 = SpeakerConfig.model_construct(voice="default_voice_2")
+# Read-only so the shared default can never be mutated by a call
+_DEFAULT_SPEAKER_CONFIGS = MappingProxyType(
+    {1: DEFAULT_SPEAKER_1, 2: DEFAULT_SPEAKER_2}
+)
+
+# Relative directories are resolved against the package's parent directory
+_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+
+def _resolve_path(path: str) -> str:
+    """Resolve a relative path against the package's parent directory."""
+    if not os.path.isabs(path):
+        path = os.path.join(_BASE_DIR, path)
+    return path
+
+
+def _ensure_directory_exists(path: str) -> str:
+    """Ensure a directory exists, resolving relative paths to absolute."""
+    path = _resolve_path(path)
+    os.makedirs(path, exist_ok=True)
+    return path
 
 
 class TextToSpeech:
@@ -41,6 +64,7 @@ class TextToSpeech:
         self,
         provider: str = "elevenlabs",
         tts_config: Optional[Union[Dict[str, Any], TTSConfig]] = None,
+        trusted: bool = False,
     ):
         """
         Initialize the TextToSpeech class.
@@ -53,15 +77,29 @@ class TextToSpeech:
                                        Can be a dictionary or a TTSConfig instance.
                                        If a dictionary is provided, it will be parsed into TTSConfig.
                                        If None, default TTSConfig settings will be used.
+            trusted (bool): Skip validation of a dictionary tts_config that is known
+                to come from an already validated source. Defaults to False.
         """
         # Instantiate TTSConfig if a dict is passed, or use the instance directly.
         if isinstance(tts_config, dict):
-            self.tts_config = TTSConfig(**tts_config)
+            self.tts_config = (
+                TTSConfig.model_construct(**tts_config)
+                if trusted
+                else TTSConfig(**tts_config)
+            )
         elif isinstance(tts_config, TTSConfig):
             self.tts_config = tts_config
         else:
             self.tts_config = TTSConfig()  # Use default if None or invalid type
 
+        # Resolve the cache directory like the other directories, before the
+        # provider opens the cache
+        cache_dir = self.tts_config.cache_dir
+        if cache_dir and not os.path.isabs(cache_dir):
+            self.tts_config = self.tts_config.model_copy(
+                update={"cache_dir": _resolve_path(cache_dir)}
+            )
+
         # Initialize provider using factory, passing the TTSConfig instance
         self.provider = TTSProviderFactory.create(
             provider_name=provider, config=self.tts_config
@@ -75,33 +113,49 @@ class TextToSpeech:
     def convert_to_speech(
         self,
         text: str,
-        speaker_configs: Dict[int, SpeakerConfig] = {
-            1: DEFAULT_SPEAKER_1,
-            2: DEFAULT_SPEAKER_2,
-        },
+        speaker_configs: Optional[Mapping[int, Union[SpeakerConfig, Dict]]] = None,
         output_file: Optional[str] = None,
         save_to_file: bool = False,
+        trusted: bool = False,
     ) -> Tuple[str, AudioSegment]:
         """
         Convert input text to speech and save as an audio file.
 
         Args:
             text (str): Input text to convert to speech.
+            speaker_configs (Optional[Mapping[int, Union[SpeakerConfig, Dict]]]): Speaker
+                configurations keyed by speaker ID. The mapping is not modified.
+                Defaults to DEFAULT_SPEAKER_1 and DEFAULT_SPEAKER_2.
             output_file (str): Path to save the output audio file.
+            trusted (bool): Skip validation of dictionary speaker configs that are
+                known to come from an already validated source. Defaults to False.
 
         Raises:
             ValueError: If the input text is not properly formatted
         """
 
-        for key, config in speaker_configs.items():
-            if not isinstance(config, SpeakerConfig):
-                speaker_configs[key] = SpeakerConfig(**config)
+        if speaker_configs is None:
+            speaker_configs = _DEFAULT_SPEAKER_CONFIGS
+
+        # Build a new mapping rather than mutating the caller's
+        if trusted:
+            converted_configs: Dict[int, SpeakerConfig] = {
+                key: (
+                    config
+                    if isinstance(config, SpeakerConfig)
+                    else SpeakerConfig.model_construct(**config)
+                )
+                for key, config in speaker_configs.items()
+            }
+        else:
+            # Existing SpeakerConfig instances are passed through as-is
+            converted_configs = SPEAKER_CONFIGS_ADAPTER.validate_python(speaker_configs)
 
         try:
             with tempfile.TemporaryDirectory(dir=self.temp_audio_dir) as temp_dir:
                 # Generate audio segments
                 audio_segments = self._generate_audio_segments(
-                    text, speaker_configs, temp_dir
+                    text, converted_configs, temp_dir
                 )
 
                 # Merge audio files into a single output
@@ -140,21 +194,24 @@ class TextToSpeech:
         # audio_files = []
         audio_file = None
 
-        if not isinstance(self.provider, GeminiMultiTTS):
-            generated_id = str(uuid.uuid4())
-            # Generate audio for all segments in a single call
-            segments = self.provider.generate_audio(segments)
-
-            # Save each audio chunk to a temporary file
-            for idx, segment in enumerate(segments):
-                if segment.audio:
-                    temp_file = os.path.join(
-                        temp_dir,
-                        f"{generated_id}_{idx}_speaker{segment.speaker_id}.{self.audio_format}",
+        # Multi-speaker providers (GeminiMultiTTS) synthesize all segments jointly;
+        # checked by capability so the provider module is not imported eagerly
+        if not hasattr(self.provider, "generate_joint_audio"):
+            generated_segments: List[SpeakerSegment] = []
+            # Decode each segment as soon as it is available, overlapping the
+            # work with pending generation. In-memory audio is decoded from a
+            # buffer; providers that stream into temp_dir set audio_file.
+            for segment in self.provider.iter_generate_audio(segments, temp_dir):
+                if segment.audio_file is not None:
+                    segment.audio_segment = AudioSegment.from_file(
+                        segment.audio_file, format=self.audio_format
+                    )
+                elif segment.audio:
+                    segment.audio_segment = AudioSegment.from_file(
+                        BytesIO(segment.audio), format=self.audio_format
                     )
-                    with open(temp_file, "wb") as f:
-                        f.write(segment.audio)
-                    segment.audio_file = temp_file
+                generated_segments.append(segment)
+            segments = generated_segments
         else:
             audio = self.provider.generate_joint_audio(segments)
             generated_id = str(uuid.uuid4())
@@ -178,18 +235,23 @@ class TextToSpeech:
         Returns:
             A list of normalized AudioSegment objects.
         """
-        # Step 1: Calculate the RMS (loudness level) for each segment
+        # Step 1: Calculate the RMS (loudness level) for each segment once
         loudness_levels = [segment[1].rms for segment in audio_segments]
 
-        # Step 2: Determine the target loudness level (mean RMS)
+        # Step 2: Determine the target loudness level (mean RMS) in dB
         target_loudness = sum(loudness_levels) / len(loudness_levels)
+        target_db = 20 * log10(target_loudness)
 
         # Step 3: Normalize each segment to the target loudness
         normalized_segments = []
         for segment_tuple, segment_loudness in zip(audio_segments, loudness_levels):
 
-            gain = 20 * math.log10(target_loudness / segment_loudness)
-            normalized_audio = segment_tuple[1].apply_gain(gain)
+            gain = target_db - 20 * log10(segment_loudness)
+            # Segments already at the target level (e.g. a single joint audio
+            # file) are reused as-is instead of copying the whole buffer
+            normalized_audio = (
+                segment_tuple[1].apply_gain(gain) if gain else segment_tuple[1]
+            )
             if segment_tuple[0] is not None:
                 segment_tuple[0].audio_segment = normalized_audio
 
@@ -197,61 +259,68 @@ class TextToSpeech:
 
         return normalized_segments
 
+    @staticmethod
+    def _has_emote(speaker_segment: SpeakerSegment) -> bool:
+        """Whether the segment's audio ends with a spoken emote to be cut off."""
+        return (
+            bool(speaker_segment.voice_config.use_emote)
+            and speaker_segment.parameters.get("emote") is not None
+        )
+
     def _split_audio_on_silence(
         self, audio: AudioSegment, speaker_segment: SpeakerSegment
     ) -> Tuple[SpeakerSegment, AudioSegment]:
         """
         Split the given audio into chunks based on silence detection.
 
+        Only called for segments with an emote, whose audio ends in the
+        spoken emote after a pause.
+
         Args:
             audio: The combined audio segment to be split
 
         Returns:
             A list of audio chunks split based on silence
         """
-        if (
-            speaker_segment.voice_config.use_emote
-            and speaker_segment.parameters.get("emote") is not None
-        ):
-            silence_threshold = -40  # Silence threshold in dB
-            min_silence_len = (
-                int(round(float(speaker_segment.voice_config.emote_pause) * 1000))
-                or 2000
-            )
+        voice_config = speaker_segment.voice_config
+        silence_threshold = -40  # Silence threshold in dB
+        min_silence_len = int(round(float(voice_config.emote_pause) * 1000)) or 2000
 
-            try:
-                chunks = split_on_silence(  # Using split_on_silence from pydub.silence
-                    audio,
-                    min_silence_len=min_silence_len,
-                    silence_thresh=silence_threshold,
-                    keep_silence=speaker_segment.voice_config.emote_merge_pause or 500,
-                )
+        try:
+            chunks = split_on_silence(  # Using split_on_silence from pydub.silence
+                audio,
+                min_silence_len=min_silence_len,
+                silence_thresh=silence_threshold,
+                keep_silence=voice_config.emote_merge_pause or 500,
+            )
 
-                logger.info(
-                    f"Detected {len(chunks)} chunks in the audio after silence detection."
+            logger.info(
+                f"Detected {len(chunks)} chunks in the audio after silence detection."
+            )
+            if len(chunks) > 1:
+                # Drop the last chunk and concatenate the remaining ones.
+                # Chunks share the source audio's parameters, so join the
+                # raw data once instead of copying on every addition.
+                merged_audio = chunks[0]._spawn(
+                    b"".join(chunk.raw_data for chunk in chunks[:-1])
                 )
-                if len(chunks) > 1:
-                    # Drop the last chunk and concatenate the remaining ones
-                    merged_audio = sum(chunks[:-1])
-                    speaker_segment.audio_segment = merged_audio
-                    return (speaker_segment, merged_audio)
-                speaker_segment.audio_segment = audio
-                return (
-                    speaker_segment,
-                    audio,
-                )  # Return the original audio if only one chunk
-            except Exception as e:
-                logger.error(f"Error during silence detection: {str(e)}")
-                raise
-        else:
+                speaker_segment.audio_segment = merged_audio
+                return (speaker_segment, merged_audio)
             speaker_segment.audio_segment = audio
-            return (speaker_segment, audio)
+            return (
+                speaker_segment,
+                audio,
+            )  # Return the original audio if only one chunk
+        except Exception as e:
+            logger.error(f"Error during silence detection: {str(e)}")
+            raise
 
     def _merge_audio_files(
         self,
         audio_files: tuple[List[SpeakerSegment], Union[str | None]],
         output_file: Optional[str],
         save_to_file: bool = False,
+        keep_segments: bool = False,
     ) -> Tuple[List[SpeakerSegment], AudioSegment]:
         """
         Merge the provided audio files sequentially, ensuring questions come before answers,
@@ -260,6 +329,8 @@ class TextToSpeech:
         Args:
             audio_files: Tuple of list of speaker segments with files to merge and audio file (if GeminiMultiSpeaker)
             output_file: Path to save the merged audio file
+            keep_segments: Keep each segment's decoded audio_segment after merging.
+                By default it is released once its duration is recorded.
         """
 
         try:
@@ -278,11 +349,12 @@ class TextToSpeech:
                 audio_segments: List[
                     Tuple[Union[SpeakerSegment, None], AudioSegment]
                 ] = [
-                    self._split_audio_on_silence(
-                        AudioSegment.from_file(
-                            segment.audio_file, format=self.audio_format
-                        ),
-                        segment,
+                    # Only emote segments need the silence scan; the rest
+                    # already carry their decoded audio
+                    (
+                        self._split_audio_on_silence(segment.audio_segment, segment)
+                        if self._has_emote(segment)
+                        else (segment, segment.audio_segment)
                     )
                     for segment in audio_files[0]
                 ]
@@ -290,18 +362,31 @@ class TextToSpeech:
             # Step 2: Normalize all audio segments
             normalized_segments = self._normalize_audio_segments(audio_segments)
 
-            # Step 3: Combine all normalized audio segments
-            combined = AudioSegment.empty()
-            for segment in normalized_segments:
-                combined += segment
+            # Step 3: Combine all normalized audio segments with a single copy,
+            # after syncing channels, frame rate and sample width like `+` does
+            if normalized_segments:
+                synced_segments = AudioSegment._sync(*normalized_segments)
+                combined = synced_segments[0]._spawn(
+                    b"".join(segment.raw_data for segment in synced_segments)
+                )
+                del synced_segments
+            else:
+                combined = AudioSegment.empty()
+            # Drop the intermediate copies so only the combined audio stays alive
+            del audio_segments, normalized_segments
 
             segments: List[SpeakerSegment] = []
             cur_time = 0
             for segment in audio_files[0]:
-                segment.audio_length = segment.audio_segment.__len__()
-                segment.start_time = cur_time
-                cur_time += segment.audio_length
-                segment.end_time = cur_time
+                # Jointly synthesized segments have no audio of their own, so
+                # their timing is unknown
+                if segment.audio_segment is not None:
+                    segment.audio_length = len(segment.audio_segment)
+                    segment.start_time = cur_time
+                    cur_time += segment.audio_length
+                    segment.end_time = cur_time
+                    if not keep_segments:
+                        segment.audio_segment = None
                 segments.append(segment)
 
             if save_to_file:
@@ -318,26 +403,14 @@ class TextToSpeech:
             logger.error(f"Error merging and normalizing audio files: {str(e)}")
             raise
 
-    def _ensure_directory_exists(self, path: str) -> str:
-        """Ensure a directory exists, resolving relative paths to absolute."""
-        if not os.path.isabs(path):
-            base_dir = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), os.pardir)
-            )
-            path = os.path.join(base_dir, path)
-        os.makedirs(path, exist_ok=True)
-        return path
-
     def _setup_directories(self) -> None:
         """Setup required directories for audio processing."""
         self.output_directories = self.tts_config.output_directories
         temp_dir_path = self.tts_config.temp_audio_dir
-        self.temp_audio_dir = self._ensure_directory_exists(temp_dir_path)
+        self.temp_audio_dir = _ensure_directory_exists(temp_dir_path)
 
         # Create output directories if they don't exist
         for dir_key in ["transcripts", "audio"]:
             dir_path = self.output_directories.get(dir_key)
             if dir_path:
-                self.output_directories[dir_key] = self._ensure_directory_exists(
-                    dir_path
-                )
+                self.output_directories[dir_key] = _ensure_directory_exists(dir_path)
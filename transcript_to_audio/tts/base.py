@@ -1,17 +1,47 @@
 """Abstract base class for Text-to-Speech providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, ClassVar, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 import re
 
 from ..schemas import SpeakerConfig, SpeakerSegment, TTSConfig
 
+# Patterns used by split_qa, compiled once at import time
+_PERSON_RE = re.compile(
+    r"<person(\d+)(.*?)>(.*?)</person\1>", re.DOTALL | re.IGNORECASE
+)
+_ATTR_RE = re.compile(r'(\w+)="(.*?)"')
+
 
 class TTSProvider(ABC):
     """Abstract base class that defines the interface for TTS providers."""
 
     # Common SSML tags supported by most providers
-    COMMON_SSML_TAGS: ClassVar[List[str]] = ["lang", "p", "phoneme", "s", "sub"]
+    COMMON_SSML_TAGS: ClassVar[Tuple[str, ...]] = ("lang", "p", "phoneme", "s", "sub")
+
+    # SSML tags supported by this provider; subclasses override the constant
+    # rather than get_supported_tags so no list is built per call. Tuples, so
+    # the shared tags cannot be changed through get_supported_tags
+    SUPPORTED_TAGS: ClassVar[Tuple[str, ...]] = COMMON_SSML_TAGS
+
+    # Requests run concurrently when config.concurrency is unset; providers
+    # whose APIs enforce lower concurrency limits override it
+    DEFAULT_CONCURRENCY: ClassVar[int] = 8
 
     def __init__(self, config: TTSConfig):
         """
@@ -22,6 +52,13 @@ class TTSProvider(ABC):
         """
         self.config = config
 
+    def _concurrency(self) -> int:
+        """Return the number of requests to run concurrently, at least one."""
+        concurrency = self.config.concurrency
+        if concurrency is None:
+            concurrency = self.DEFAULT_CONCURRENCY
+        return max(1, concurrency)
+
     @abstractmethod
     def generate_audio(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
         """
@@ -41,14 +78,189 @@ class TTSProvider(ABC):
             "Subclasses must implement the generate_audio method."
         )
 
-    def get_supported_tags(self) -> List[str]:
+    async def agenerate_audio(
+        self, segments: List[SpeakerSegment]
+    ) -> List[SpeakerSegment]:
+        """
+        Asynchronously generate audio for a list of SpeakerSegment objects.
+
+        Lets async callers await generation without blocking their event loop.
+        The default implementation runs generate_audio in a worker thread;
+        providers with a native async client override it.
+
+        Args:
+            segments: List of SpeakerSegment objects containing text and voice configurations.
+
+        Returns:
+            List of SpeakerSegment objects with audio set, in input order.
+        """
+        return await asyncio.to_thread(self.generate_audio, segments)
+
+    @staticmethod
+    def _run_until_complete(coroutine: Awaitable[Any]) -> Any:
+        """
+        Run a coroutine to completion from synchronous code.
+
+        Lets providers with a native async client implement generate_audio on
+        top of agenerate_audio. Without a running event loop the coroutine
+        runs on a new loop; inside one (e.g. a notebook) nest_asyncio is
+        applied to that loop so it can be re-entered.
+
+        Args:
+            coroutine: The coroutine to run.
+
+        Returns:
+            The result of the coroutine.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        import nest_asyncio
+
+        nest_asyncio.apply(loop)
+        return loop.run_until_complete(coroutine)
+
+    async def _agather_segments(
+        self,
+        func: Callable[[SpeakerSegment], Awaitable[Any]],
+        segments: List[SpeakerSegment],
+    ) -> List[Any]:
+        """
+        Await func for each segment with up to config.concurrency in flight.
+
+        Args:
+            func: Coroutine function generating audio for a single segment.
+            segments: List of SpeakerSegment objects.
+
+        Returns:
+            List of the results of func in input order. The first exception
+            raised by func is propagated.
+        """
+        semaphore = asyncio.Semaphore(self._concurrency())
+
+        async def _bounded(segment: SpeakerSegment) -> Any:
+            async with semaphore:
+                return await func(segment)
+
+        return list(await asyncio.gather(*(_bounded(s) for s in segments)))
+
+    def iter_generate_audio(
+        self, segments: List[SpeakerSegment], output_dir: Optional[str] = None
+    ) -> Iterator[SpeakerSegment]:
+        """
+        Yield SpeakerSegments in input order as their audio becomes available.
+
+        Providers that generate segments concurrently override this so callers
+        can process finished segments while later ones are still in flight.
+        The default implementation generates all segments first.
+
+        Args:
+            segments: List of SpeakerSegment objects containing text and voice configurations.
+            output_dir: Optional directory providers may stream audio files into.
+                Segments written there have audio_file set instead of audio.
+
+        Yields:
+            SpeakerSegment objects with audio or audio_file set.
+        """
+        yield from self.generate_audio(segments)
+
+    def _iter_map_segments(
+        self,
+        func: Callable[..., Any],
+        segments: List[SpeakerSegment],
+        *iterables: Iterable[Any],
+    ) -> Iterator[Any]:
+        """
+        Apply func to each segment using up to config.concurrency threads.
+
+        All segments are submitted up front and results are yielded in input
+        order as soon as they are ready.
+
+        Args:
+            func: Callable generating audio for a single segment.
+            segments: List of SpeakerSegment objects.
+            *iterables: Extra per-segment arguments passed to func alongside
+                each segment, as with map().
+
+        Yields:
+            The results of func in input order. The first exception raised
+            by func is propagated.
+        """
+        max_workers = max(1, min(self._concurrency(), len(segments)))
+        if max_workers == 1:
+            yield from map(func, segments, *iterables)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(func, segments, *iterables)
+
+    def _map_segments(
+        self,
+        func: Callable[..., Any],
+        segments: List[SpeakerSegment],
+        *iterables: Iterable[Any],
+    ) -> List[Any]:
+        """
+        Apply func to each segment using up to config.concurrency threads.
+
+        Args:
+            func: Callable generating audio for a single segment.
+            segments: List of SpeakerSegment objects.
+            *iterables: Extra per-segment arguments passed to func alongside
+                each segment, as with map().
+
+        Returns:
+            List of the results of func in input order. The first exception
+            raised by func is propagated.
+        """
+        return list(self._iter_map_segments(func, segments, *iterables))
+
+    def _iter_deduplicated(
+        self,
+        segments: List[SpeakerSegment],
+        keys: List[Hashable],
+        generate: Callable[[List[int]], Iterator[SpeakerSegment]],
+    ) -> Iterator[SpeakerSegment]:
+        """
+        Generate each distinct request once and share its audio with repeats.
+
+        Args:
+            segments: List of SpeakerSegment objects.
+            keys: Hashable key per segment identifying its synthesis request.
+            generate: Callable given the indices of the first segment for each
+                key, yielding those segments in order as they are generated.
+
+        Yields:
+            All segments in input order with audio or audio_file set.
+        """
+        first_indices: Dict[Hashable, int] = {}
+        for i, key in enumerate(keys):
+            first_indices.setdefault(key, i)
+        generated = generate(list(first_indices.values()))
+        for i, (segment, key) in enumerate(zip(segments, keys)):
+            source_index = first_indices[key]
+            if source_index == i:
+                next(generated)
+            else:
+                # A repeat always follows its first occurrence, which has
+                # already been generated
+                source = segments[source_index]
+                segment.audio = source.audio
+                segment.audio_file = source.audio_file
+            yield segment
+        # Let the generator finish so its resources are released
+        for _ in generated:
+            pass
+
+    def get_supported_tags(self) -> Tuple[str, ...]:
         """
         Get set of SSML tags supported by this provider.
 
         Returns:
-            Set of supported SSML tag names
+            Tuple of supported SSML tag names
         """
-        return self.COMMON_SSML_TAGS.copy()
+        return self.SUPPORTED_TAGS
 
     def validate_parameters(
         self, text: str, voice: str, model: str, voice2: str = None
@@ -70,14 +282,14 @@ class TTSProvider(ABC):
         self,
         input_text: str,
         speaker_configs: Dict[int, SpeakerConfig],
-        supported_tags: List[str] = None,
+        supported_tags: Optional[Sequence[str]] = None,
     ) -> List[SpeakerSegment]:
         """
         Parse input text into a list of SpeakerSegment instances.
 
         Args:
             input_text (str): The input text containing <personN> tags.
-            supported_tags (List[str]): Supported SSML tags.
+            supported_tags (Sequence[str]): Supported SSML tags.
 
         Returns:
             List[SpeakerSegment]: A list of SpeakerSegment instances.
@@ -85,32 +297,41 @@ class TTSProvider(ABC):
         # Clean the input text
         input_text = self.clean_tss_markup(input_text, supported_tags=supported_tags)
 
-        # Regular expression pattern to match <personN> tags
-        pattern = r"<person(\d+)(.*?)>(.*?)</person\1>"
-        matches = re.findall(pattern, input_text, re.DOTALL | re.IGNORECASE)
+        # Match <personN> tags in a single pass
+        matches = _PERSON_RE.findall(input_text)
+
+        # Resolve each speaker's configuration once rather than per segment;
+        # model_validate passes existing SpeakerConfig instances through as-is.
+        resolved_configs: Dict[int, SpeakerConfig] = {
+            key: SpeakerConfig.model_validate(config)
+            for key, config in speaker_configs.items()
+        }
+        schema_fields = SpeakerConfig.model_fields.keys()
 
         segments: List[SpeakerSegment] = []
         for speaker_id, params, text in matches:
             speaker_id = int(speaker_id)
 
             # Parse parameters into a dictionary
-            param_dict = dict(re.findall(r'(\w+)="(.*?)"', params))
+            param_dict = dict(_ATTR_RE.findall(params))
 
             # Retrieve default configuration for the speaker ID
-            default_config = speaker_configs.get(speaker_id, {}).copy()
+            default_config = resolved_configs.get(speaker_id)
+            if default_config is None:
+                default_config = resolved_configs[speaker_id] = SpeakerConfig()
 
             # Identify fields in param_dict that match the SpeakerConfig schema
-            schema_fields = SpeakerConfig.model_fields.keys()
             matched_fields = {
                 key: value for key, value in param_dict.items() if key in schema_fields
             }
 
-            # Only create a new instance if there are matching fields; otherwise, use default_config directly
+            # Only validate a new instance if the tag overrides fields; otherwise share the speaker's config
             if matched_fields:
-                updated_config = {**default_config, **matched_fields}
-                speaker_config = SpeakerConfig.model_validate(updated_config)
+                speaker_config = SpeakerConfig.model_validate(
+                    {**default_config.model_dump(), **matched_fields}
+                )
             else:
-                speaker_config = SpeakerConfig.model_validate(default_config)
+                speaker_config = default_config
 
             segments.append(
                 SpeakerSegment(speaker_id, param_dict, text.strip(), speaker_config)
@@ -123,7 +344,7 @@ class TTSProvider(ABC):
         self,
         input_text: str,
         additional_tags: List[str] = ["Person1", "Person2"],
-        supported_tags: List[str] = None,
+        supported_tags: Optional[Sequence[str]] = None,
         person_tag: str = "Person",
     ) -> str:
         """
@@ -132,20 +353,20 @@ class TTSProvider(ABC):
         Args:
             input_text (str): The input text containing TSS markup tags.
             additional_tags (List[str]): Optional list of additional tags to preserve. Defaults to ["Person1", "Person2"].
-            supported_tags (List[str]): Optional list of supported tags. If None, use COMMON_SSML_TAGS.
+            supported_tags (Sequence[str]): Optional supported tags. If None, use COMMON_SSML_TAGS.
             person_tag (str): Base name for person tags (e.g., "Person"). Defaults to "Person".
 
         Returns:
             str: Cleaned text with unsupported TSS markup tags removed.
         """
         if supported_tags is None:
-            supported_tags = self.COMMON_SSML_TAGS.copy()
+            supported_tags = self.COMMON_SSML_TAGS
 
         # Dynamically generate person tags pattern (e.g., Person1, Person2, ..., PersonN)
         person_tag_pattern = f"{person_tag}\\d+"
 
         # Combine supported tags and additional tags
-        all_supported_tags = supported_tags + additional_tags
+        all_supported_tags = [*supported_tags, *additional_tags]
 
         # Create a pattern that matches any tag not in the supported list
         # pattern = (
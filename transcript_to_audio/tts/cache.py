@@ -0,0 +1,154 @@
+"""Persistent content-addressed cache for synthesized segment audio."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger("transcript_to_audio_logger")
+
+# Entry file names: the hex digest from make_key and the audio format. Other
+# files in the directory are never counted or evicted
+_ENTRY_RE = re.compile(r"[0-9a-f]{32}\.\w+")
+
+
+class AudioCache:
+    """
+    Stores synthesized audio on disk keyed by the request that produced it.
+
+    Entries are plain files named by a BLAKE2b digest of the request, so
+    unchanged segments can be reused across runs. When the total size exceeds
+    size_limit the least recently used entries are evicted. Only files named
+    like entries are counted or evicted, so other files in the directory are
+    left alone.
+    """
+
+    def __init__(self, directory: str, size_limit: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory (str): Directory holding the cached audio files.
+            size_limit (Optional[int]): Maximum total size in bytes. None
+                disables eviction.
+        """
+        self.directory = directory
+        self.size_limit = size_limit
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # Running total of the entry sizes, so writes only rescan the
+        # directory when the limit is exceeded
+        self._total_size = sum(size for _, size, _ in self._scan())
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from the parts of a synthesis request.
+
+        Args:
+            *parts: JSON serializable values that determine the audio.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, key: str, audio_format: str) -> str:
+        return os.path.join(self.directory, f"{key}.{audio_format}")
+
+    def get(self, key: str, audio_format: str) -> Optional[bytes]:
+        """
+        Return the cached audio for a key, or None on a miss.
+
+        Args:
+            key (str): Key from make_key.
+            audio_format (str): Audio format used as the file extension.
+        """
+        path = self._path(key, audio_format)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+            # Mark as recently used for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        logger.debug(f"Audio cache hit: {key}")
+        return audio
+
+    def put(
+        self,
+        key: str,
+        audio_format: str,
+        audio: Optional[bytes] = None,
+        audio_file: Optional[str] = None,
+    ) -> None:
+        """
+        Store audio under a key from either bytes or an existing file.
+
+        The entry is written to a temporary file and moved into place, so
+        readers never see a partially written entry.
+
+        Args:
+            key (str): Key from make_key.
+            audio_format (str): Audio format used as the file extension.
+            audio (Optional[bytes]): The audio data.
+            audio_file (Optional[str]): Path of a file holding the audio data.
+        """
+        path = self._path(key, audio_format)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if audio_file is not None:
+                    with open(audio_file, "rb") as src:
+                        shutil.copyfileobj(src, f)
+                else:
+                    f.write(audio)
+                size = f.tell()
+            with self._lock:
+                try:
+                    replaced_size = os.path.getsize(path)
+                except FileNotFoundError:
+                    replaced_size = 0
+                os.replace(tmp_path, path)
+                self._total_size += size - replaced_size
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        if self.size_limit is not None and self._total_size > self.size_limit:
+            self._evict()
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """Return (mtime, size, path) for every cache entry in the directory."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not _ENTRY_RE.fullmatch(entry.name) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until within size_limit."""
+        with self._lock:
+            # Rescan, as other processes may share the directory
+            entries = self._scan()
+            total = sum(size for _, size, _ in entries)
+            if total > self.size_limit:
+                entries.sort()
+                for _, size, path in entries:
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    if total <= self.size_limit:
+                        break
+            self._total_size = total
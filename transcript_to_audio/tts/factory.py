@@ -1,11 +1,9 @@
 """Factory for creating TTS provider instances."""
 
-from .providers.edge import EdgeTTS
-from .providers.elevenlabs import ElevenLabsTTS
-from .providers.gemini import GeminiTTS
-from .providers.geminimulti import GeminiMultiTTS
-from .providers.openai import OpenAITTS
-from .providers.azureopenai import AzureOpenAITTS
+from importlib import import_module
+from types import MappingProxyType
+from typing import Dict, Type
+
 from .base import TTSProvider
 from ..schemas import TTSConfig
 
@@ -13,16 +11,43 @@ from ..schemas import TTSConfig
 class TTSProviderFactory:
     """
     Factory class for creating TTS provider instances.
+
+    Provider modules are imported on first use so that only the SDK of the
+    requested provider is loaded.
     """
 
-    _providers = {
-        "edge": EdgeTTS,
-        "elevenlabs": ElevenLabsTTS,
-        "gemini": GeminiTTS,
-        "geminimulti": GeminiMultiTTS,
-        "openai": OpenAITTS,
-        "azureopenai": AzureOpenAITTS,
-    }
+    _providers = MappingProxyType(
+        {
+            "edge": (".providers.edge", "EdgeTTS"),
+            "elevenlabs": (".providers.elevenlabs", "ElevenLabsTTS"),
+            "gemini": (".providers.gemini", "GeminiTTS"),
+            "geminimulti": (".providers.geminimulti", "GeminiMultiTTS"),
+            "openai": (".providers.openai", "OpenAITTS"),
+            "azureopenai": (".providers.azureopenai", "AzureOpenAITTS"),
+        }
+    )
+    _resolved: Dict[str, Type[TTSProvider]] = {}
+
+    @staticmethod
+    def get_provider_class(provider_name: str) -> Type[TTSProvider]:
+        """
+        Resolve a provider class, importing its module on first use.
+
+        Args:
+            provider_name (str): Name of the provider (e.g., 'edge', 'elevenlabs').
+
+        Returns:
+            Type[TTSProvider]: The requested TTS provider class.
+        """
+        provider_cls = TTSProviderFactory._resolved.get(provider_name)
+        if provider_cls is None:
+            location = TTSProviderFactory._providers.get(provider_name)
+            if location is None:
+                raise ValueError(f"Unknown provider: {provider_name}")
+            module_name, class_name = location
+            provider_cls = getattr(import_module(module_name, __package__), class_name)
+            TTSProviderFactory._resolved[provider_name] = provider_cls
+        return provider_cls
 
     @staticmethod
     def create(provider_name: str, config: TTSConfig) -> TTSProvider:
@@ -36,6 +61,4 @@ class TTSProviderFactory:
         Returns:
             TTSProvider: An instance of the requested TTS provider.
         """
-        if provider_name not in TTSProviderFactory._providers:
-            raise ValueError(f"Unknown provider: {provider_name}")
-        return TTSProviderFactory._providers[provider_name](config)
+        return TTSProviderFactory.get_provider_class(provider_name)(config)
@@ -1,8 +1,11 @@
 """Azure OpenAI TTS provider implementation."""
 
 import logging
+import os
+import tempfile
+from functools import partial
 from openai import AzureOpenAI
-from typing import List
+from typing import Iterator, List, Optional
 from ..base import SpeakerSegment, TTSProvider
 from ...schemas import TTSConfig
 
@@ -36,28 +39,52 @@ class AzureOpenAITTS(TTSProvider):
             api_key=self.api_key,
         )
 
-    def get_supported_tags(self) -> List[str]:
-        """Get supported SSML tags."""
-        return self.COMMON_SSML_TAGS
-
     def generate_audio(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
         """
-        Generate audio using Azure OpenAI TTS API for all SpeakerSegments in a single call.
+        Generate audio using Azure OpenAI TTS API for all SpeakerSegments,
+        running up to config.concurrency requests in parallel.
+        """
+        return list(self.iter_generate_audio(segments))
+
+    def iter_generate_audio(
+        self, segments: List[SpeakerSegment], output_dir: Optional[str] = None
+    ) -> Iterator[SpeakerSegment]:
+        """Yield SpeakerSegments in order as their concurrent requests finish."""
+        return self._iter_map_segments(
+            partial(self._generate_segment_audio, output_dir=output_dir), segments
+        )
+
+    def _generate_segment_audio(
+        self, segment: SpeakerSegment, output_dir: Optional[str] = None
+    ) -> SpeakerSegment:
+        """
+        Generate audio for a single SpeakerSegment.
+
+        The response is streamed straight into a file in output_dir when one is
+        given, so the audio is never held in memory in full.
         """
-        for segment in segments:
-            logger.info(
-                f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        logger.info(
+            f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        )
+        try:
+            with self.client.audio.speech.with_streaming_response.create(
+                model=self.config.model or "gpt-4o-audio-preview",
+                voice=segment.voice_config.voice or "alloy",
+                input=segment.text,
+            ) as response:
+                if output_dir:
+                    fd, audio_file = tempfile.mkstemp(
+                        suffix=f".{self.config.audio_format}", dir=output_dir
+                    )
+                    with os.fdopen(fd, "wb") as f:
+                        for chunk in response.iter_bytes(chunk_size=16384):
+                            f.write(chunk)
+                    segment.audio_file = audio_file
+                else:
+                    segment.audio = response.read()
+        except Exception as e:
+            logger.error(
+                f"Failed to generate audio for Speaker {segment.speaker_id}: {str(e)}"
             )
-            try:
-                response = self.client.audio.speech.create(
-                    model=self.config.model or "gpt-4o-audio-preview",
-                    voice=segment.voice_config.voice or "alloy",
-                    input=segment.text,
-                )
-                segment.audio = response.content
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate audio for Speaker {segment.speaker_id}: {str(e)}"
-                )
-                raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
-        return segments
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+        return segment
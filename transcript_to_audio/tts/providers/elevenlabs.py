@@ -1,21 +1,85 @@
 """ElevenLabs TTS provider implementation."""
 
+import difflib
 import logging
+import os
+import random
+import tempfile
+import threading
 import time
+import httpx
 from elevenlabs import (
-    SpeechHistoryItemResponse,
     VoiceSettings,
     client as elevenlabs_client,
 )
 from elevenlabs.client import is_voice_id
+from elevenlabs.core import ApiError
 from ..base import TTSProvider
-from typing import List
+from ..cache import AudioCache
+from functools import lru_cache, partial
+from typing import Dict, Iterator, List, Optional
 from ...schemas import SAID_TRANSLATIONS, SpeakerSegment, TTSConfig
 
 logger = logging.getLogger("transcript_to_audio_logger")
 
 
+@lru_cache(maxsize=None)
+def _said_strings(language: str) -> tuple[str, str, str]:
+    """Return the said-phrases for a language code, resolved once per code."""
+    return SAID_TRANSLATIONS.get(language.lower(), SAID_TRANSLATIONS["en"])
+
+
+# Pause inserted between same-speaker turns synthesized in one request
+_TURN_BREAK = ' <break time="0.3s" /> '
+
+# Retry delays grow exponentially from the base up to the cap, in seconds
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30.0
+
+# Rate limited requests, including too_many_concurrent_requests, only succeed
+# once other requests have finished, so they back off longer and retry more
+_RATE_LIMIT_BACKOFF_BASE = 2.0
+_RATE_LIMIT_RETRIES = 6
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Whether a failed request may succeed when retried; 429s are handled apart."""
+    if isinstance(exc, ApiError):
+        status_code = exc.status_code
+        return status_code is None or status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _backoff_delay(attempt: int, base: float = _BACKOFF_BASE) -> float:
+    """
+    Seconds to wait before retrying after the given zero-based attempt.
+
+    The delay is a jittered exponential backoff so parallel requests do not
+    retry in lockstep. The SDK's ApiError does not carry the response
+    headers, so a Retry-After header cannot be honoured.
+    """
+    return min(_BACKOFF_CAP, base * 2**attempt) * random.uniform(0.5, 1.5)
+
+
+# SDK clients shared by all providers using the same API key, so the HTTP
+# connection pool is reused instead of reconnecting for every instance
+_CLIENTS: Dict[str, elevenlabs_client.ElevenLabs] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_client(api_key: str) -> elevenlabs_client.ElevenLabs:
+    """Return the shared ElevenLabs client for an API key."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = _CLIENTS[api_key] = elevenlabs_client.ElevenLabs(api_key=api_key)
+        return client
+
+
 class ElevenLabsTTS(TTSProvider):
+    # Lower plans allow only a few concurrent requests
+    DEFAULT_CONCURRENCY = 2
+
     def __init__(self, config: TTSConfig):
         """
         Initialize ElevenLabs TTS provider.
@@ -28,103 +92,185 @@ class ElevenLabsTTS(TTSProvider):
             raise ValueError(
                 "ElevenLabs API key must be provided in the configuration."
             )
-        self.client = elevenlabs_client.ElevenLabs(api_key=config.api_key)
+        self.client = _get_client(config.api_key)
         # Use the model from config or default to "eleven_multilingual_v2" if None
         self.model = config.model or "eleven_multilingual_v2"
+        # Optional persistent cache of synthesized segments
+        self.cache = (
+            AudioCache(config.cache_dir, config.cache_size_limit)
+            if config.cache_dir
+            else None
+        )
+        # Voice name to ID mapping, fetched on the first lookup by name
+        self._voice_name_to_id: Optional[Dict[str, str]] = None
+        self._voice_lock = threading.Lock()
+
+    def _resolve_voice_id(self, voice: str) -> str:
+        """
+        Resolve a voice ID or voice name to a voice ID.
+
+        The voice library is fetched on first use and cached. A name missing
+        from the cache fetches it again, in case the voice was added since.
+        Names, and display_name label aliases, are matched exactly apart from
+        case and surrounding whitespace.
+
+        Raises:
+            ValueError: If no voice with the given name exists. The message
+                suggests close matches when there are any.
+        """
+        voice = voice.strip()
+        if is_voice_id(voice):
+            return voice
+        key = voice.casefold()
+        with self._voice_lock:
+            if self._voice_name_to_id is None or key not in self._voice_name_to_id:
+                voices_response = self.client.voices.get_all(show_legacy=True)
+                voice_name_to_id: Dict[str, str] = {}
+                for v in voices_response.voices:
+                    # Keep the first voice listed for each name
+                    voice_name_to_id.setdefault(v.name.strip().casefold(), v.voice_id)
+                # Display name labels are aliases; they never shadow real names
+                for v in voices_response.voices:
+                    display_name = (v.labels or {}).get("display_name")
+                    if display_name:
+                        voice_name_to_id.setdefault(
+                            display_name.strip().casefold(), v.voice_id
+                        )
+                self._voice_name_to_id = voice_name_to_id
+            voice_id = self._voice_name_to_id.get(key)
+        if voice_id is None:
+            message = f"Voice model {voice} not found."
+            close_matches = difflib.get_close_matches(key, self._voice_name_to_id)
+            if close_matches:
+                message += f" Did you mean: {', '.join(close_matches)}?"
+            raise ValueError(message)
+        return voice_id
+
+    def _refresh_voice_id(self, voice: str) -> Optional[str]:
+        """
+        Refetch the voice library and resolve a voice name again.
+
+        Returns:
+            The voice ID, or None if the voice is given by ID or no longer exists.
+        """
+        if is_voice_id(voice.strip()):
+            return None
+        with self._voice_lock:
+            self._voice_name_to_id = None
+        try:
+            return self._resolve_voice_id(voice)
+        except ValueError:
+            return None
 
     def generate_audio(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
         """
-        Generate audio using ElevenLabs API for all SpeakerSegments in a single call.
+        Generate audio using ElevenLabs API for all SpeakerSegments, running up
+        to config.concurrency requests in parallel, two unless configured.
         """
-        # audio_chunks = []
-        # Initialize variables for history and request tracking
-        previous_request_ids: List[tuple[str, str]] = []
-        # previous_history_id: str | None = None
+        return list(self.iter_generate_audio(segments))
 
-        for i, segment in enumerate(segments):
-            logger.info(
-                f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
-            )
-            said_str = SAID_TRANSLATIONS.get(
-                segment.voice_config.language.lower(), SAID_TRANSLATIONS["en"]
+    def iter_generate_audio(
+        self, segments: List[SpeakerSegment], output_dir: Optional[str] = None
+    ) -> Iterator[SpeakerSegment]:
+        """
+        Yield SpeakerSegments in order, generating them in concurrent waves.
+
+        Segments are synthesized in waves of config.concurrency requests. The
+        request IDs of earlier waves are passed on to later ones so ElevenLabs
+        can keep the prosody continuous across segments. Segments repeating an
+        identical request, context included, are only synthesized once.
+
+        With config.merge_speaker_turns, consecutive turns of the same speaker
+        are joined into one segment, so fewer segments are yielded.
+        """
+        if self.config.merge_speaker_turns:
+            segments = self._merge_speaker_turns(segments)
+
+        # Resolve every distinct voice up front, so an unknown voice fails
+        # before anything is synthesized rather than midway through a batch
+        for voice in {str(segment.voice_config.voice) for segment in segments}:
+            self._resolve_voice_id(voice)
+
+        context_texts = self._context_texts(segments)
+        keys = [
+            (
+                segment.text,
+                tuple(sorted(segment.parameters.items())),
+                segment.voice_config.model_dump_json(),
+                context,
             )
+            for segment, context in zip(segments, context_texts)
+        ]
+        return self._iter_deduplicated(
+            segments,
+            keys,
+            lambda indices: self._iter_waves(
+                [segments[i] for i in indices],
+                [context_texts[i] for i in indices],
+                output_dir,
+            ),
+        )
 
-            # Determine previous_text and next_text
-            # previous_text: str | None = (
-            #     segments[i - 1].text
-            #     if i > 0 and segments[i - 1].speaker_id == segment.speaker_id
-            #     else None
-            # )
-            # next_text: str | None = (
-            #     segments[i + 1].text
-            #     if i < len(segments) - 1
-            #     and segments[i + 1].speaker_id == segment.speaker_id
-            #     else None
-            # )
-            previous_text: str | None = (
-                (
-                    segments[i - 1].text
-                    if segments[i - 1].speaker_id == segment.speaker_id
-                    else segments[i - 1].text
-                    + (
-                        said_str[0] + said_str[1]
-                        if not segments[i - 1].voice_config.use_emote
-                        or segments[i - 1].parameters.get("emote") is None
-                        else (
-                            said_str[0]
-                            + segments[i - 1].parameters.get("emote", said_str[1])
-                        )
-                    )
+    @staticmethod
+    def _merge_speaker_turns(segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
+        """
+        Join consecutive segments of one speaker into a single segment.
+
+        Only segments with equal voice configs and parameters and no emote
+        are joined, as an emote has to stay at the end of its own audio.
+        """
+        runs: List[List[SpeakerSegment]] = []
+        for segment in segments:
+            previous = runs[-1][-1] if runs else None
+            if (
+                previous is not None
+                and previous.speaker_id == segment.speaker_id
+                and previous.parameters == segment.parameters
+                and previous.voice_config == segment.voice_config
+                and not (
+                    segment.voice_config.use_emote
+                    and segment.parameters.get("emote") is not None
                 )
-                if i > 0
-                else None
-            )
-            next_text: str | None = (
-                (
-                    segments[i + 1].text
-                    if segments[i + 1].speaker_id == segment.speaker_id
-                    else (
-                        said_str[0] + said_str[1] + said_str[2] + segments[i + 1].text
-                        if not segment.voice_config.use_emote
-                        or segment.parameters.get("emote") is None
-                        else (
-                            segments[i + 1].text
-                            + said_str[2]
-                            + said_str[0]
-                            + segment.parameters.get("emote", said_str[1])
-                        )
-                    )
+            ):
+                runs[-1].append(segment)
+            else:
+                runs.append([segment])
+        return [
+            (
+                run[0]
+                if len(run) == 1
+                else SpeakerSegment(
+                    speaker_id=run[0].speaker_id,
+                    parameters=run[0].parameters,
+                    text=_TURN_BREAK.join(segment.text for segment in run),
+                    voice_config=run[0].voice_config,
                 )
-                if i < (len(segments) - 1)
-                else None
-            )
-
-            # Prepare voice settings
-            voice_settings: VoiceSettings = VoiceSettings(
-                stability=segment.voice_config.stability,
-                similarity_boost=segment.voice_config.similarity_boost,
-                style=segment.voice_config.style,
-                use_speaker_boost=segment.voice_config.use_speaker_boost,
             )
+            for run in runs
+        ]
 
-            voice = (
-                str(segment.voice_config.voice).strip()
-                if isinstance(segment.voice_config.voice, str)
-                else segment.voice_config.voice
-            )
+    def _iter_waves(
+        self,
+        segments: List[SpeakerSegment],
+        context_texts: List[tuple[Optional[str], Optional[str]]],
+        output_dir: Optional[str] = None,
+    ) -> Iterator[SpeakerSegment]:
+        """
+        Generate segments in waves of config.concurrency, yielding in order.
 
-            if isinstance(voice, str) and is_voice_id(voice):
-                voice_id = voice
-            elif isinstance(voice, str):
-                voices_response = self.client.voices.get_all(show_legacy=True)
-                maybe_voice_id = next(
-                    (v.voice_id for v in voices_response.voices if v.name == voice),
-                    None,
-                )
-                if maybe_voice_id is None:
-                    raise ValueError(f"Voice model {voice} not found.")
-                voice_id = maybe_voice_id
+        Every segment of a wave is sent the request IDs of the earlier waves
+        only, since the other requests of its own wave are still running. The
+        prosody is therefore stitched across waves but not within a wave; set
+        config.concurrency to 1 to chain every request onto the one before.
+        """
+        # Initialize variables for history and request tracking
+        previous_request_ids: List[tuple[str, str]] = []
+        wave_size = self._concurrency()
 
+        for start in range(0, len(segments), wave_size):
+            end = start + wave_size
+            wave = segments[start:end]
+            wave_contexts = context_texts[start:end]
             prev_requests = previous_request_ids[-3:]
             # prev_requests.reverse()
 
@@ -132,89 +278,263 @@ class ElevenLabsTTS(TTSProvider):
                 f"previous segments: {"\n".join([str(req) for req in prev_requests])}"
             )
 
-            text = segment.text
-            if (
-                segment.voice_config.use_emote
-                and segment.voice_config.emote_pause is not None
-                and segment.parameters.get("emote", None) is not None
-            ):
-                text = (
-                    said_str[2]
-                    + text
-                    + f'<break time="{segment.voice_config.emote_pause}s" />'
-                    + said_str[0]
-                    + segment.parameters.get("emote")
-                )
+            texts = self._map_segments(
+                partial(
+                    self._generate_segment_audio,
+                    prev_requests=prev_requests,
+                    output_dir=output_dir,
+                ),
+                wave,
+                wave_contexts,
+            )
+
+            texts = [text for text in texts if text is not None]
+            if texts:
+                previous_request_ids = previous_request_ids + [
+                    request for request in self._find_requests(texts) if request
+                ]
+
+            yield from wave
 
-            audio_chunks = None
-            max_repeats = 3
-            rep = 0
-            gen_e = None
-            while rep < max_repeats and audio_chunks is None:
-                try:
-                    # Generate audiochunks_
-                    audio_chunks = self.client.text_to_speech.convert(
-                        enable_logging=True,
-                        text=text,
-                        voice_id=voice_id,
-                        model_id=self.model,
-                        previous_text=previous_text,
-                        next_text=next_text,
-                        previous_request_ids=[
-                            item[0] for item in prev_requests
-                        ],  # Use up to 3 previous IDs
-                        voice_settings=voice_settings,
+    def _context_texts(
+        self, segments: List[SpeakerSegment]
+    ) -> List[tuple[Optional[str], Optional[str]]]:
+        """
+        Build the previous_text and next_text sent with each segment.
+
+        Returns:
+            List of (previous_text, next_text) tuples in segment order.
+        """
+        # Resolve each language's said-phrases once and each segment's emote
+        # once, so the loop below only indexes precomputed values
+        said_strs: List[tuple[str, str, str]] = []
+        emotes: List[Optional[str]] = []
+        for segment in segments:
+            voice_config = segment.voice_config
+            said_strs.append(_said_strings(voice_config.language))
+            emotes.append(
+                segment.parameters.get("emote") if voice_config.use_emote else None
+            )
+
+        context_texts: List[tuple[Optional[str], Optional[str]]] = []
+        last = len(segments) - 1
+        for i, segment in enumerate(segments):
+            said_str = said_strs[i]
+
+            # Determine previous_text and next_text
+            previous_text: str | None = None
+            if i > 0:
+                previous = segments[i - 1]
+                previous_text = previous.text
+                if previous.speaker_id != segment.speaker_id:
+                    emote = emotes[i - 1]
+                    previous_text += said_str[0] + (
+                        said_str[1] if emote is None else emote
                     )
-                except Exception as e:
-                    gen_e = e
-                    time.sleep(2)
-                    rep += 1
-
-            if audio_chunks is None:
-                raise ValueError(
-                    f"Unable to generate audio_chunks. \nError: {gen_e}"
-                ) from gen_e
-
-            # Append audio chunks
-            segment.audio = b"".join(chunk for chunk in audio_chunks if chunk)
-            prev_len = len(previous_request_ids)
-            max_repeats = 3
-            rep = 0
-            while rep < max_repeats and prev_len == len(previous_request_ids):
-                logger.info("Try to find history item")
-
-                # Fetch updated history after generation
-                history_response = self.client.history.get_all(
-                    page_size=4,
-                    # start_after_history_item_id=previous_history_id,
-                )
-                history_response_items: List[SpeechHistoryItemResponse] = sorted(
-                    history_response.history,
-                    key=lambda item: item.date_unix,
-                    reverse=True,
-                )
-                # logger.info(
-                #     f"history response {[tuple([item.request_id, item.text]) for item in history_response.history]}"
-                # )
-                first_match = next(
-                    (
-                        tuple([item.request_id, item.text])
-                        for item in history_response_items
-                        if item.request_id and item.text == text
-                    ),
-                    None,  # Default value if no match is found
+
+            next_text: str | None = None
+            if i < last:
+                following = segments[i + 1]
+                if following.speaker_id == segment.speaker_id:
+                    next_text = following.text
+                elif emotes[i] is None:
+                    next_text = said_str[0] + said_str[1] + said_str[2] + following.text
+                else:
+                    next_text = following.text + said_str[2] + said_str[0] + emotes[i]
+
+            context_texts.append((previous_text, next_text))
+        return context_texts
+
+    def _generate_segment_audio(
+        self,
+        segment: SpeakerSegment,
+        context: tuple[Optional[str], Optional[str]],
+        prev_requests: List[tuple[str, str]],
+        output_dir: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Generate audio for a single SpeakerSegment and store it on the segment.
+
+        The audio is streamed straight into a file in output_dir when one is
+        given, so the audio is never held in memory in full.
+
+        Args:
+            segment: The segment to synthesize.
+            context: The (previous_text, next_text) pair for the segment.
+            prev_requests: Up to three earlier (request_id, text) pairs.
+            output_dir: Optional directory to write the audio file into.
+
+        Returns:
+            The text sent to ElevenLabs, used to find the request in history,
+            or None when the audio was served from the cache.
+        """
+        logger.info(
+            f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        )
+        previous_text, next_text = context
+        voice_config = segment.voice_config
+        emote = segment.parameters.get("emote")
+        said_str = _said_strings(voice_config.language)
+
+        # Prepare voice settings
+        voice_settings: VoiceSettings = VoiceSettings(
+            stability=voice_config.stability,
+            similarity_boost=voice_config.similarity_boost,
+            style=voice_config.style,
+            use_speaker_boost=voice_config.use_speaker_boost,
+        )
+
+        voice = str(voice_config.voice)
+        voice_id = self._resolve_voice_id(voice)
+        voice_refreshed = False
+
+        text = segment.text
+        emote_pause = voice_config.emote_pause
+        if voice_config.use_emote and emote_pause is not None and emote is not None:
+            text = (
+                said_str[2]
+                + text
+                + f'<break time="{emote_pause}s" />'
+                + said_str[0]
+                + emote
+            )
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = AudioCache.make_key(
+                voice_id,
+                self.model,
+                self.config.output_format,
+                text,
+                voice_settings.model_dump(),
+                previous_text,
+                next_text,
+            )
+            cached_audio = self.cache.get(cache_key, self.config.audio_format)
+            if cached_audio is not None:
+                segment.audio = cached_audio
+                # No new history item exists to chain later requests onto
+                return None
+
+        audio_file = None
+        if output_dir:
+            fd, audio_file = tempfile.mkstemp(
+                suffix=f".{self.config.audio_format}", dir=output_dir
+            )
+            os.close(fd)
+
+        max_repeats = 3
+        attempt = 0
+        rate_limited = 0
+        while True:
+            try:
+                # The streaming endpoint returns the first chunks while the
+                # rest is still being synthesized, and they are written out as
+                # they arrive. The call is lazy, so request errors surface
+                # while the chunks are read and must be caught here.
+                audio_chunks = self.client.text_to_speech.convert_as_stream(
+                    enable_logging=True,
+                    text=text,
+                    voice_id=voice_id,
+                    model_id=self.model,
+                    output_format=self.config.output_format,
+                    previous_text=previous_text,
+                    next_text=next_text,
+                    previous_request_ids=[
+                        item[0] for item in prev_requests
+                    ],  # Use up to 3 previous IDs
+                    voice_settings=voice_settings,
                 )
-                if first_match is not None:
-                    logger.info("Found item")
-                    previous_request_ids = previous_request_ids + [first_match]
+                if audio_file:
+                    # Reopened on every attempt so a retry overwrites a
+                    # partially written file
+                    with open(audio_file, "wb") as f:
+                        for chunk in audio_chunks:
+                            if chunk:
+                                f.write(chunk)
+                    segment.audio_file = audio_file
                 else:
-                    time.sleep(2)
-                    rep += 1
+                    # Accumulate in place rather than materializing a list of
+                    # every chunk for join
+                    buffer = bytearray()
+                    for chunk in audio_chunks:
+                        if chunk:
+                            buffer += chunk
+                    segment.audio = bytes(buffer)
+                break
+            except (ApiError, httpx.TransportError) as e:
+                if isinstance(e, ApiError) and e.status_code == 404:
+                    # The cached ID of a named voice may be stale, so refetch
+                    # the voice library once and retry if the name now maps
+                    # elsewhere
+                    refreshed_id = None
+                    if not voice_refreshed and attempt < max_repeats - 1:
+                        voice_refreshed = True
+                        refreshed_id = self._refresh_voice_id(voice)
+                    if refreshed_id is None or refreshed_id == voice_id:
+                        raise ValueError(
+                            f"Unable to generate audio_chunks. \nError: {e}"
+                        ) from e
+                    voice_id = refreshed_id
+                elif isinstance(e, ApiError) and e.status_code == 429:
+                    if rate_limited == _RATE_LIMIT_RETRIES:
+                        raise ValueError(
+                            f"Unable to generate audio_chunks. \nError: {e}"
+                        ) from e
+                    time.sleep(_backoff_delay(rate_limited, _RATE_LIMIT_BACKOFF_BASE))
+                    rate_limited += 1
+                    continue
+                else:
+                    if attempt == max_repeats - 1 or not _is_retryable(e):
+                        raise ValueError(
+                            f"Unable to generate audio_chunks. \nError: {e}"
+                        ) from e
+                    time.sleep(_backoff_delay(attempt))
+                attempt += 1
+
+        if cache_key is not None:
+            self.cache.put(
+                cache_key,
+                self.config.audio_format,
+                audio=segment.audio,
+                audio_file=audio_file,
+            )
+        return text
 
-            # if history_response.history:
-            #     previous_history_id = history_response.history[-1].history_item_id
-        return segments
+    def _find_requests(self, texts: List[str]) -> List[Optional[tuple[str, str]]]:
+        """
+        Find the (request_id, text) pairs of a wave of generations in the history.
+
+        The recent history is fetched once per attempt and matched by text,
+        instead of polling it separately for every generation.
+
+        Args:
+            texts: The texts that were sent for the generations.
+
+        Returns:
+            The matching pair for each text, or None if it did not appear in time.
+        """
+        wanted = set(texts)
+        requests: Dict[str, tuple[str, str]] = {}
+        max_repeats = 3
+        rep = 0
+        while rep < max_repeats:
+            logger.info("Try to find history items")
 
-    def get_supported_tags(self) -> List[str]:
-        """Get supported SSML tags."""
-        return ["lang", "p", "phoneme", "s", "sub"]
+            # Fetch updated history after generation
+            history_response = self.client.history.get_all(page_size=max(4, len(texts)))
+            # The history is returned newest first, so the first item seen for
+            # a text is its most recent generation
+            for item in history_response.history:
+                if (
+                    item.request_id
+                    and item.text in wanted
+                    and item.text not in requests
+                ):
+                    requests[item.text] = (item.request_id, item.text)
+            if len(requests) == len(wanted):
+                logger.info("Found items")
+                break
+            time.sleep(_backoff_delay(rep))
+            rep += 1
+        return [requests.get(text) for text in texts]
@@ -1,13 +1,49 @@
 """Google Cloud Text-to-Speech provider implementation for single speaker."""
 
 from google.cloud import texttospeech
-from typing import List
+from google.cloud.texttospeech_v1.services.text_to_speech.transports import (
+    TextToSpeechGrpcTransport,
+)
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from ..base import SpeakerSegment, TTSProvider
-from ...schemas import TTSConfig
+from ...schemas import SpeakerConfig, TTSConfig
 import logging
+import threading
 
 logger = logging.getLogger("transcript_to_audio_logger")
 
+# gRPC clients shared by all providers using the same API key, so the
+# channel is reused instead of reconnecting for every instance
+_CLIENTS: Dict[Optional[str], texttospeech.TextToSpeechClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Keepalive pings stop idle connections from being dropped between requests,
+# so the shared channel stays warm across batches
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+]
+
+
+def _create_channel(host: str, options: Sequence[Tuple[str, Any]] = (), **kwargs):
+    """Create the gRPC channel for a client with the keepalive options added."""
+    return TextToSpeechGrpcTransport.create_channel(
+        host, options=[*options, *_CHANNEL_OPTIONS], **kwargs
+    )
+
+
+def _get_client(api_key: Optional[str]) -> texttospeech.TextToSpeechClient:
+    """Return the shared Google Cloud TTS client for an API key."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = _CLIENTS[api_key] = texttospeech.TextToSpeechClient(
+                client_options={"api_key": api_key},
+                transport=partial(TextToSpeechGrpcTransport, channel=_create_channel),
+            )
+        return client
+
 
 class GeminiTTS(TTSProvider):
     """Google Cloud Text-to-Speech provider for single speaker."""
@@ -23,86 +59,103 @@ class GeminiTTS(TTSProvider):
         # Use the model from config or default to "en-US-Journey-F" if None
         self.model = config.model or "en-US-Journey-F"
         try:
-            self.client = texttospeech.TextToSpeechClient(
-                client_options={"api_key": config.api_key}
-            )
+            self.client = _get_client(config.api_key)
             logger.info("Successfully initialized GeminiTTS client")
         except Exception as e:
             logger.error(f"Failed to initialize Google TTS client: {str(e)}")
             raise
 
-    def generate_audio(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
-        """
-        Generate audio using Google Cloud TTS API for all SpeakerSegments in a single call.
-        """
-        for segment in segments:
-            logger.info(
-                f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        # Request messages shared by all segments, built once
+        self._audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.MP3
+        )
+        self._voice_params_cache: Dict[
+            Tuple[str, str, str], texttospeech.VoiceSelectionParams
+        ] = {}
+
+    def _voice_params(
+        self, voice_config: SpeakerConfig
+    ) -> texttospeech.VoiceSelectionParams:
+        """Return the voice selection for a speaker, building it once per voice."""
+        # Ensure ssml_gender is uppercase and handle potential None
+        ssml_gender = (voice_config.ssml_gender or "NEUTRAL").upper()
+        key = (voice_config.language, voice_config.voice, ssml_gender)
+        voice_params = self._voice_params_cache.get(key)
+        if voice_params is None:
+            ssml_gender_enum = getattr(
+                texttospeech.SsmlVoiceGender,
+                ssml_gender,
+                texttospeech.SsmlVoiceGender.NEUTRAL,
             )
-
-            try:
-                # Create synthesis input
-                synthesis_input = texttospeech.SynthesisInput(text=segment.text)
-
-                # Set voice parameters
-                # Ensure ssml_gender is uppercase and handle potential None
-                ssml_gender = (segment.voice_config.ssml_gender or "NEUTRAL").upper()
-                ssml_gender_enum = getattr(
-                    texttospeech.SsmlVoiceGender,
-                    ssml_gender,
-                    texttospeech.SsmlVoiceGender.NEUTRAL,
-                )
-
-                voice_params = texttospeech.VoiceSelectionParams(
-                    language_code=segment.voice_config.language,
-                    name=segment.voice_config.voice,
+            voice_params = self._voice_params_cache.setdefault(
+                key,
+                texttospeech.VoiceSelectionParams(
+                    language_code=voice_config.language,
+                    name=voice_config.voice,
                     ssml_gender=ssml_gender_enum,
-                )
-
-                # Set audio config
-                audio_config = texttospeech.AudioConfig(
-                    audio_encoding=texttospeech.AudioEncoding.MP3
-                )
-
-                # Generate speech
-                response = self.client.synthesize_speech(
-                    request={
-                        "input": synthesis_input,
-                        "voice": voice_params,
-                        "audio_config": audio_config,
-                    }
-                )
-
-                segment.audio = response.audio_content
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate audio for Speaker {segment.speaker_id}: {str(e)}"
-                )
-                raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+                ),
+            )
+        return voice_params
 
-        return segments
+    def generate_audio(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
+        """
+        Generate audio using Google Cloud TTS API for all SpeakerSegments,
+        running up to config.concurrency requests in parallel.
+        """
+        return list(self.iter_generate_audio(segments))
 
-    def get_supported_tags(self) -> List[str]:
-        """Get supported SSML tags."""
-        return self.COMMON_SSML_TAGS
+    def iter_generate_audio(
+        self, segments: List[SpeakerSegment], output_dir: Optional[str] = None
+    ) -> Iterator[SpeakerSegment]:
+        """
+        Yield SpeakerSegments in order as their concurrent requests finish.
 
-    def validate_parameters(self, text: str, voice: str, model: str) -> None:
+        The gRPC client is thread-safe and multiplexes the requests over a
+        single channel. Segments repeating an identical request are only
+        synthesized once.
         """
-        Validate input parameters before generating audio.
+        keys = [
+            (
+                segment.text,
+                segment.voice_config.language,
+                segment.voice_config.voice,
+                (segment.voice_config.ssml_gender or "NEUTRAL").upper(),
+            )
+            for segment in segments
+        ]
+        return self._iter_deduplicated(
+            segments,
+            keys,
+            lambda indices: self._iter_map_segments(
+                self._generate_segment_audio, [segments[i] for i in indices]
+            ),
+        )
+
+    def _generate_segment_audio(self, segment: SpeakerSegment) -> SpeakerSegment:
+        """Generate audio for a single SpeakerSegment."""
+        logger.info(
+            f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        )
 
-        Args:
-            text (str): Input text
-            voice (str): Voice ID/name
-            model (str): Model name
+        try:
+            # Create synthesis input
+            synthesis_input = texttospeech.SynthesisInput(text=segment.text)
+
+            # Generate speech
+            response = self.client.synthesize_speech(
+                request={
+                    "input": synthesis_input,
+                    "voice": self._voice_params(segment.voice_config),
+                    "audio_config": self._audio_config,
+                }
+            )
 
-        Raises:
-            ValueError: If parameters are invalid
-        """
-        super().validate_parameters(text, voice, model)
+            segment.audio = response.audio_content
 
-        if not text:
-            raise ValueError("Text cannot be empty")
+        except Exception as e:
+            logger.error(
+                f"Failed to generate audio for Speaker {segment.speaker_id}: {str(e)}"
+            )
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
 
-        if not voice:
-            raise ValueError("Voice must be specified")
+        return segment
@@ -1,18 +1,238 @@
 """Google Cloud Text-to-Speech provider implementation."""
 
-import os  # Added
-import tempfile  # Added
 from google.cloud import texttospeech
-from typing import List
+from typing import Iterable, List, Optional, Tuple, TypeVar
 from ..base import SpeakerSegment, TTSProvider
+from ..cache import AudioCache
+from .gemini import _get_client
 from ...schemas import TTSConfig
+import os
 import re
 import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pydub import AudioSegment
 
 logger = logging.getLogger("transcript_to_audio_logger")
 
+_T = TypeVar("_T")
+
+# Patterns used by chunk_text and split_turn_text, compiled once at import time
+_TAG_RE = re.compile(r"<(Person[12])>(.*?)</Person[12]>", re.DOTALL | re.IGNORECASE)
+_SENTENCE_RE = re.compile(r"([.!?]+(?:\s+|$))")
+
+# Layer III bitrates in kbps by bitrate index, for MPEG-1 and MPEG-2/2.5
+_MP3_BITRATES = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by MPEG version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+# ffmpeg raw PCM formats by sample width in bytes. pydub keeps 8-bit audio
+# signed in memory and only biases it to unsigned when writing WAV
+_PCM_FORMATS = {1: "s8", 2: "s16le", 4: "s32le"}
+
+
+def _mp3_frame_info(data: bytes) -> Optional[Tuple[Tuple[int, int, int], int]]:
+    """
+    Parse the MPEG audio Layer III frame header at the start of data.
+
+    Returns:
+        ((version, sample rate index, channel mode), frame length in bytes),
+        or None if data does not start with a valid Layer III frame.
+    """
+    if len(data) < 4 or data[0] != 0xFF or data[1] & 0xE0 != 0xE0:
+        return None
+    version = (data[1] >> 3) & 0x03
+    layer = (data[1] >> 1) & 0x03
+    bitrate_index = data[2] >> 4
+    sample_rate_index = (data[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[mpeg1][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    padding = (data[2] >> 1) & 0x01
+    frame_length = (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+    return (version, sample_rate_index, data[3] >> 6), frame_length
+
+
+def _mp3_frames(chunk: bytes) -> Optional[Tuple[Tuple[int, int, int], bytes]]:
+    """
+    Strip ID3 tags and any Xing/Info/VBRI header frame from an MP3 chunk.
+
+    Returns:
+        (stream format, audio frames), or None if the chunk does not start
+        with a Layer III frame once its tags are removed.
+    """
+    start = 0
+    end = len(chunk)
+    if chunk[:3] == b"ID3" and end >= 10:
+        # Syncsafe tag size, plus the header and an optional footer
+        size = (
+            (chunk[6] & 0x7F) << 21
+            | (chunk[7] & 0x7F) << 14
+            | (chunk[8] & 0x7F) << 7
+            | (chunk[9] & 0x7F)
+        )
+        start = 10 + size + (10 if chunk[5] & 0x10 else 0)
+    if end - start >= 128 and chunk.startswith(b"TAG", end - 128):
+        end -= 128
+    frames = chunk[start:end]
+    info = _mp3_frame_info(frames)
+    if info is None:
+        return None
+    stream_format, frame_length = info
+    # The header frame describes only this chunk's length, so drop it
+    if any(tag in frames[:frame_length] for tag in (b"Xing", b"Info", b"VBRI")):
+        frames = frames[frame_length:]
+        if frames and _mp3_frame_info(frames) is None:
+            return None
+    return stream_format, frames
+
+
+def _concat_mp3_frames(audio_chunks: List[bytes]) -> Optional[bytes]:
+    """
+    Merge MP3 chunks by joining their frames, without decoding or re-encoding.
+
+    Args:
+        audio_chunks (List[bytes]): List of MP3 audio data
+
+    Returns:
+        Optional[bytes]: The joined MP3 data, or None if a chunk is not a plain
+            Layer III stream or the chunks differ in version, sample rate or
+            channel mode, in which case they have to be merged by decoding.
+    """
+    parts = []
+    stream_format = None
+    for chunk in audio_chunks:
+        if not chunk:
+            continue
+        parsed = _mp3_frames(chunk)
+        if parsed is None:
+            return None
+        if stream_format is None:
+            stream_format = parsed[0]
+        elif parsed[0] != stream_format:
+            return None
+        parts.append(parsed[1])
+    if not parts:
+        return None
+    return b"".join(parts)
+
+
+def _utf8_length(text: str) -> int:
+    """Return the UTF-8 encoded length of text, without encoding ASCII text."""
+    # isascii reads a flag CPython keeps on the string, and ASCII characters
+    # are one byte each in UTF-8
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
+
+
+def _pack_by_size(items: Iterable[Tuple[_T, int]], max_bytes: int) -> List[List[_T]]:
+    """
+    Group consecutive (item, size) pairs so each group's sizes sum to max_bytes.
+
+    An item larger than max_bytes alone gets a group of its own.
+    """
+    groups: List[List[_T]] = []
+    current: List[_T] = []
+    current_bytes = 0
+    for item, size in items:
+        if current_bytes + size > max_bytes and current:
+            groups.append(current)
+            current = []
+            current_bytes = 0
+        current.append(item)
+        current_bytes += size
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _decode_mp3_chunk(index: int, chunk: bytes) -> Optional[AudioSegment]:
+    """
+    Decode one MP3 chunk for merging.
+
+    Args:
+        index (int): Position of the chunk, used in log messages
+        chunk (bytes): MP3 audio data
+
+    Returns:
+        Optional[AudioSegment]: The decoded audio, or None if the chunk is
+            empty or cannot be decoded.
+    """
+    try:
+        if not chunk or len(chunk) == 0:
+            logger.warning(f"Skipping empty chunk {index}")
+            return None
+
+        # Decode the chunk straight from memory
+        segment = AudioSegment.from_file(BytesIO(chunk), format="mp3")
+        if len(segment) > 0:
+            logger.debug(f"Successfully processed chunk {index}")
+            return segment
+        logger.warning(f"Zero-length segment in chunk {index}")
+
+    except Exception as e:
+        logger.error(f"Error processing chunk {index}: {str(e)}")
+    return None
+
+
+def _encode_mp3(segment: AudioSegment, bitrate: str) -> bytes:
+    """
+    Encode audio to MP3 by piping raw PCM through ffmpeg.
+
+    Unlike AudioSegment.export this writes no temporary WAV and MP3 files;
+    the samples go to ffmpeg's stdin and the MP3 data is read from stdout.
+
+    Args:
+        segment (AudioSegment): The audio to encode
+        bitrate (str): Target bitrate, e.g. "320k"
+
+    Returns:
+        bytes: MP3 audio data
+    """
+    sample_format = _PCM_FORMATS.get(segment.sample_width)
+    if sample_format is None:
+        output = BytesIO()
+        segment.export(output, format="mp3", codec="libmp3lame", bitrate=bitrate)
+        return output.getvalue()
+    command = [
+        AudioSegment.converter,
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        sample_format,
+        "-ar",
+        str(segment.frame_rate),
+        "-ac",
+        str(segment.channels),
+        "-i",
+        "pipe:0",
+        "-codec:a",
+        "libmp3lame",
+        "-b:a",
+        bitrate,
+        "-f",
+        "mp3",
+        "pipe:1",
+    ]
+    process = subprocess.run(command, input=segment.raw_data, capture_output=True)
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg exited with code {process.returncode}: "
+            f"{process.stderr.decode(errors='replace')}"
+        )
+    return process.stdout
+
 
 class GeminiMultiTTS(TTSProvider):
     """Google Cloud Text-to-Speech provider with multi-speaker support."""
@@ -28,13 +248,41 @@ class GeminiMultiTTS(TTSProvider):
         # Use the model from config or default to "en-US-Studio-MultiSpeaker" if None
         self.model = config.model or "en-US-Studio-MultiSpeaker"
         try:
-            self.client = texttospeech.TextToSpeechClient(
-                client_options={"api_key": config.api_key}
-            )
+            self.client = _get_client(config.api_key)
             logger.info("Successfully initialized GeminiMultiTTS client")
         except Exception as e:
             logger.error(f"Failed to initialize GeminiMultiTTS client: {str(e)}")
             raise
+        # Pin the sample rate so every batch has the same MP3 frame format
+        # and merge_audio can join their frames without decoding
+        self._audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.MP3,
+            sample_rate_hertz=config.sample_rate_hz,
+        )
+        # Optional persistent cache of synthesized batches
+        self.cache = (
+            AudioCache(config.cache_dir, config.cache_size_limit)
+            if config.cache_dir
+            else None
+        )
+
+    def generate_audio(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
+        """
+        Generate audio for each SpeakerSegment separately, running up to
+        config.concurrency requests in parallel.
+
+        TextToSpeech synthesizes the whole transcript with generate_joint_audio;
+        this gives each segment its own audio as a single-turn request.
+        """
+        return self._map_segments(self._generate_segment_audio, segments)
+
+    def _generate_segment_audio(self, segment: SpeakerSegment) -> SpeakerSegment:
+        """Generate audio for a single SpeakerSegment."""
+        logger.info(
+            f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        )
+        segment.audio = self._synthesize_turns([segment])
+        return segment
 
     def chunk_text(self, text: str, max_bytes: int = 1300) -> List[str]:
         """
@@ -49,45 +297,20 @@ class GeminiMultiTTS(TTSProvider):
         """
         logger.debug(f"Starting chunk_text with text length: {len(text)} bytes")
 
-        # Split text into tagged sections, preserving both Person1 and Person2 tags
-        pattern = r"(<Person[12]>.*?</Person[12]>)"
-        sections = re.split(pattern, text, flags=re.DOTALL | re.IGNORECASE)
-        sections = [s.strip() for s in sections if s.strip()]
-        logger.debug(f"Split text into {len(sections)} sections")
-
-        chunks = []
-        current_chunk = ""
-
-        for section in sections:
-            # Extract speaker tag and content if this is a tagged section
-            tag_match = re.match(
-                r"<(Person[12])>(.*?)</Person[12]>",
-                section,
-                flags=re.DOTALL | re.IGNORECASE,
-            )
-
-            if tag_match:
-                speaker_tag = tag_match.group(1)  # Will be either Person1 or Person2
-                content = tag_match.group(2).strip()
-
-                # Test if adding this entire section would exceed limit
-                test_chunk = current_chunk
-                if current_chunk:
-                    test_chunk += f"<{speaker_tag}>{content}</{speaker_tag}>"
-                else:
-                    test_chunk = f"<{speaker_tag}>{content}</{speaker_tag}>"
-
-                if len(test_chunk.encode("utf-8")) > max_bytes and current_chunk:
-                    # Store current chunk and start new one
-                    chunks.append(current_chunk)
-                    current_chunk = f"<{speaker_tag}>{content}</{speaker_tag}>"
-                else:
-                    # Add to current chunk
-                    current_chunk = test_chunk
-
-        # Add final chunk if it exists
-        if current_chunk:
-            chunks.append(current_chunk)
+        # Find the tagged sections in a single scan; text between them is not
+        # spoken and is dropped. Each section is wrapped and its UTF-8 length
+        # measured once, so the loop below only needs a running byte total
+        pieces = []
+        for tag_match in _TAG_RE.finditer(text):
+            speaker_tag = tag_match.group(1)  # Will be either Person1 or Person2
+            content = tag_match.group(2).strip()
+            wrapped = f"<{speaker_tag}>{content}</{speaker_tag}>"
+            pieces.append((wrapped, _utf8_length(wrapped)))
+        logger.debug(f"Split text into {len(pieces)} sections")
+
+        # Sections are collected per chunk and joined once when it is full,
+        # instead of growing a string with every section
+        chunks = ["".join(group) for group in _pack_by_size(pieces, max_bytes)]
 
         logger.info(f"Created {len(chunks)} chunks from input text")
         return chunks
@@ -106,113 +329,118 @@ class GeminiMultiTTS(TTSProvider):
         if len(text) <= max_chars:
             return [text]
 
+        # End offsets of the non-empty pieces _SENTENCE_RE.split would return,
+        # alternating sentence and separator; found without slicing the text
+        bounds = []
+        previous = 0
+        for match in _SENTENCE_RE.finditer(text):
+            if match.start() > previous:
+                bounds.append(match.start())
+            bounds.append(match.end())
+            previous = match.end()
+        if len(text) > previous:
+            bounds.append(len(text))
+        # Each sentence ends after its separator, or at the last piece
+        sentence_ends = bounds[1::2]
+        if len(bounds) % 2:
+            sentence_ends.append(bounds[-1])
+
+        # The current chunk is text[start:position], preceded by head when a
+        # long sentence was split into words. Chunks are sliced from the text
+        # once instead of growing a string with every sentence
         chunks = []
-        sentences = re.split(r"([.!?]+(?:\s+|$))", text)
-        sentences = [s for s in sentences if s]
-
-        current_chunk = ""
-        for i in range(0, len(sentences), 2):
-            sentence = sentences[i]
-            separator = sentences[i + 1] if i + 1 < len(sentences) else ""
-            complete_sentence = sentence + separator
-
-            if len(current_chunk) + len(complete_sentence) > max_chars:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = complete_sentence
+        head = ""
+        start = 0
+        position = 0
+        for end in sentence_ends:
+            current_length = len(head) + position - start
+            if current_length + end - position > max_chars:
+                if current_length:
+                    chunks.append((head + text[start:position]).strip())
+                    head = ""
+                    start = position
                 else:
                     # If a single sentence is too long, split at word boundaries
-                    words = complete_sentence.split()
-                    temp_chunk = ""
+                    words = text[position:end].split()
+                    temp_words = []
+                    temp_length = 0
                     for word in words:
-                        if len(temp_chunk) + len(word) + 1 > max_chars:
-                            chunks.append(temp_chunk.strip())
-                            temp_chunk = word
+                        if temp_length + len(word) + 1 > max_chars:
+                            chunks.append(" ".join(temp_words))
+                            temp_words = [word]
+                            temp_length = len(word)
                         else:
-                            temp_chunk += " " + word if temp_chunk else word
-                    current_chunk = temp_chunk
-            else:
-                current_chunk += complete_sentence
+                            temp_length += len(word) + (1 if temp_words else 0)
+                            temp_words.append(word)
+                    head = " ".join(temp_words)
+                    start = end
+            position = end
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if head or position > start:
+            chunks.append((head + text[start:position]).strip())
 
         return chunks
 
-    def merge_audio(self, audio_chunks: List[bytes]) -> bytes:
+    def merge_audio(self, audio_chunks: List[bytes], strict: bool = False) -> bytes:
         """
-        Merge multiple MP3 audio chunks into a single audio file using temporary files.
+        Merge multiple MP3 audio chunks into a single audio file in memory.
 
         Args:
             audio_chunks (List[bytes]): List of MP3 audio data
+            strict (bool): Raise if any chunk is empty or cannot be decoded, or
+                the merge fails, instead of skipping chunks and falling back to
+                the first chunk.
 
         Returns:
             bytes: Combined MP3 audio data
+
+        Raises:
+            RuntimeError: If strict and the chunks cannot all be merged
         """
         if not audio_chunks:
             return b""
 
+        if strict and not all(audio_chunks):
+            raise RuntimeError("Cannot merge empty audio chunks")
+
         if len(audio_chunks) == 1:
             return audio_chunks[0]
 
+        # Chunks from the same voice and config share their MP3 stream
+        # format, so their frames can be joined without decoding
+        concatenated = _concat_mp3_frames(audio_chunks)
+        if concatenated is not None:
+            return concatenated
+
         try:
-            combined = None
-            valid_chunks = []
-            temp_files_to_clean = []  # Keep track of temp files
-
-            for i, chunk in enumerate(audio_chunks):
-                temp_file_path = None
-                try:
-                    if not chunk or len(chunk) == 0:
-                        logger.warning(f"Skipping empty chunk {i}")
-                        continue
-
-                    # Create a named temporary file in the configured directory
-                    with tempfile.NamedTemporaryFile(
-                        suffix=".mp3", delete=False, dir=self.config.temp_audio_dir
-                    ) as tmp_file:
-                        temp_file_path = tmp_file.name
-                        tmp_file.write(chunk)
-                        temp_files_to_clean.append(
-                            temp_file_path
-                        )  # Add to cleanup list
-
-                    # Create audio segment from the temporary file
-                    segment = AudioSegment.from_file(temp_file_path, format="mp3")
-                    if len(segment) > 0:
-                        valid_chunks.append(segment)
-                        logger.debug(
-                            f"Successfully processed chunk {i} using {temp_file_path}"
-                        )
-                    else:
-                        logger.warning(f"Zero-length segment in chunk {i}")
-
-                except Exception as e:
-                    logger.error(f"Error processing chunk {i}: {str(e)}")
-                    # Attempt cleanup even if processing failed for this chunk
-                    if temp_file_path and os.path.exists(temp_file_path):
-                        try:
-                            os.remove(temp_file_path)
-                            if temp_file_path in temp_files_to_clean:
-                                temp_files_to_clean.remove(temp_file_path)
-                        except OSError as rm_err:
-                            logger.warning(
-                                f"Could not remove temp file {temp_file_path} after error: {rm_err}"
-                            )
-                    continue  # Continue to next chunk
+            # Decoding runs in ffmpeg subprocesses, so chunks can be decoded
+            # in parallel; map keeps them in input order
+            max_workers = min(len(audio_chunks), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                decoded = executor.map(
+                    _decode_mp3_chunk, range(len(audio_chunks)), audio_chunks
+                )
+                decoded = list(decoded)
+            if strict and any(segment is None for segment in decoded):
+                raise RuntimeError("Failed to decode audio chunks")
+            valid_chunks = [segment for segment in decoded if segment is not None]
 
             if not valid_chunks:
                 raise RuntimeError("No valid audio chunks to merge")
 
-            # Merge valid chunks
-            combined = valid_chunks[0]
-            for segment in valid_chunks[1:]:
-                combined = combined + segment
+            # Merge valid chunks with a single copy, after syncing channels,
+            # frame rate and sample width like `+` does. join sizes its
+            # output up front, so this is the only allocation for the PCM
+            synced_chunks = AudioSegment._sync(*valid_chunks)
+            combined = synced_chunks[0]._spawn(
+                b"".join(segment.raw_data for segment in synced_chunks)
+            )
+            # Release the per-chunk PCM before encoding, so only the combined
+            # copy is held while ffmpeg runs
+            del valid_chunks, synced_chunks
 
             # Export combined audio
-            output = BytesIO()
-            combined.export(output, format="mp3", codec="libmp3lame", bitrate="320k")
-            result = output.getvalue()
+            result = _encode_mp3(combined, bitrate="320k")
 
             if len(result) == 0:
                 raise RuntimeError("Export produced empty output")
@@ -221,31 +449,78 @@ class GeminiMultiTTS(TTSProvider):
 
         except Exception as e:
             logger.error(f"Audio merge failed: {str(e)}", exc_info=True)
+            if strict:
+                raise RuntimeError(f"Failed to merge audio chunks: {str(e)}") from e
             # Fallback logic remains the same
             if audio_chunks:
                 return audio_chunks[0]
             raise RuntimeError(
                 f"Failed to merge audio chunks and no valid fallback found: {str(e)}"
             )
-        finally:
-            # Final cleanup of all successfully created temp files
-            for temp_file_path in temp_files_to_clean:
-                if os.path.exists(temp_file_path):
-                    try:
-                        os.remove(temp_file_path)
-                        logger.debug(f"Cleaned up temp file: {temp_file_path}")
-                    except OSError as e:
-                        logger.warning(
-                            f"Could not remove temp file {temp_file_path} during final cleanup: {e}"
-                        )
 
     def generate_joint_audio(self, segments: List[SpeakerSegment]) -> bytes:
         """
         Generate audio using Google Cloud TTS API with multi-speaker support.
-        Handles all SpeakerSegment instances in a single call.
+        Handles all SpeakerSegment instances in a single call when their text
+        fits in one request, otherwise merges the audio of each batch.
         """
         logger.info(f"Starting audio generation for {len(segments)} segments")
 
+        batches = self.batch_segments(segments)
+        if len(batches) <= 1:
+            return self._synthesize_turns(segments)
+        logger.info(f"Generating audio for {len(batches)} batches")
+        # A dropped batch would silently cut the transcript short, so the
+        # merge must not skip chunks or fall back to the first one
+        return self.merge_audio(
+            self._map_segments(self._synthesize_turns, batches), strict=True
+        )
+
+    def batch_segments(
+        self, segments: List[SpeakerSegment], max_bytes: int = 1300
+    ) -> List[List[SpeakerSegment]]:
+        """
+        Group consecutive segments into batches that fit the request byte limit.
+
+        A segment whose text alone exceeds max_bytes gets a batch of its own.
+
+        Args:
+            segments (List[SpeakerSegment]): Segments to group
+            max_bytes (int): Maximum bytes of turn text per batch
+
+        Returns:
+            List[List[SpeakerSegment]]: Batches of segments in input order
+        """
+        return _pack_by_size(
+            ((segment, _utf8_length(segment.text.strip())) for segment in segments),
+            max_bytes,
+        )
+
+    def _synthesize_turns(self, segments: List[SpeakerSegment]) -> bytes:
+        """
+        Synthesize segments as the turns of a single multi-speaker request.
+
+        Args:
+            segments (List[SpeakerSegment]): Segments to synthesize
+
+        Returns:
+            bytes: MP3 audio data
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = AudioCache.make_key(
+                "geminimulti",
+                self.model,
+                self.config.sample_rate_hz,
+                [
+                    (segment.voice_config.voice, segment.text.strip())
+                    for segment in segments
+                ],
+            )
+            cached_audio = self.cache.get(cache_key, "mp3")
+            if cached_audio is not None:
+                return cached_audio
+
         try:
             # Create multi-speaker markup
             multi_speaker_markup = texttospeech.MultiSpeakerMarkup(
@@ -268,27 +543,21 @@ class GeminiMultiTTS(TTSProvider):
                 language_code="en-US", name=self.model
             )
 
-            # Set audio config
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3
-            )
-
             # Generate speech
             logger.debug("Calling synthesize_speech API")
             response = self.client.synthesize_speech(
-                input=synthesis_input, voice=voice_params, audio_config=audio_config
+                input=synthesis_input,
+                voice=voice_params,
+                audio_config=self._audio_config,
             )
 
-            return response.audio_content
-
         except Exception as e:
             # logger.error(f"Failed to generate audio: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to generate audio: {str(e)}")  # from e
 
-    def get_supported_tags(self) -> List[str]:
-        """Get supported SSML tags."""
-        # Add any Google-specific SSML tags to the common ones
-        return self.COMMON_SSML_TAGS
+        if cache_key is not None:
+            self.cache.put(cache_key, "mp3", audio=response.audio_content)
+        return response.audio_content
 
     def validate_parameters(self, text: str, voice: str, model: str) -> None:
         """
@@ -2,8 +2,10 @@
 
 import logging
 import openai
-from typing import List
+from functools import partial
+from typing import List, Tuple
 from ..base import SpeakerSegment, TTSProvider
+from ..cache import AudioCache
 from ...schemas import TTSConfig
 
 logger = logging.getLogger("transcript_to_audio_logger")
@@ -13,7 +15,10 @@ class OpenAITTS(TTSProvider):
     """OpenAI Text-to-Speech provider."""
 
     # Provider-specific SSML tags
-    PROVIDER_SSML_TAGS: List[str] = ["break", "emphasis"]
+    PROVIDER_SSML_TAGS: Tuple[str, ...] = ("break", "emphasis")
+    SUPPORTED_TAGS: Tuple[str, ...] = PROVIDER_SSML_TAGS
+    # Values accepted by the API's response_format
+    SUPPORTED_FORMATS: Tuple[str, ...] = ("mp3", "opus", "aac", "flac", "wav", "pcm")
 
     def __init__(self, config: TTSConfig):
         """
@@ -38,12 +43,17 @@ class OpenAITTS(TTSProvider):
         self.streaming = config.streaming
         self.speed = config.speed
         self.language = config.language
+        # Optional persistent cache of synthesized segments
+        self.cache = (
+            AudioCache(config.cache_dir, config.cache_size_limit)
+            if config.cache_dir
+            else None
+        )
 
         # Validate response format
-        valid_formats = ["mp3", "opus", "aac", "flac", "wav", "pcm"]
-        if self.audio_format not in valid_formats:
+        if self.audio_format not in self.SUPPORTED_FORMATS:
             raise ValueError(
-                f"Invalid response format: {self.audio_format}. Must be one of {valid_formats}."
+                f"Invalid response format: {self.audio_format}. Must be one of {self.SUPPORTED_FORMATS}."
             )
 
         # Validate speed
@@ -52,39 +62,74 @@ class OpenAITTS(TTSProvider):
                 f"Invalid speed: {self.speed}. Must be between 0.5 and 2.0."
             )
 
-    def get_supported_tags(self) -> List[str]:
-        """Get all supported SSML tags including provider-specific ones."""
-        return self.PROVIDER_SSML_TAGS
-
     def generate_audio(self, segments: List[SpeakerSegment]) -> List[SpeakerSegment]:
         """
-        Generate audio using OpenAI API for all SpeakerSegments in a single call.
+        Generate audio using OpenAI API for all SpeakerSegments, running up to
+        config.concurrency requests concurrently.
+        """
+        return self._run_until_complete(self.agenerate_audio(segments))
+
+    async def agenerate_audio(
+        self, segments: List[SpeakerSegment]
+    ) -> List[SpeakerSegment]:
         """
-        for segment in segments:
-            logger.info(
-                f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        Generate audio for all SpeakerSegments on the running event loop,
+        with up to config.concurrency requests in flight.
+        """
+        # The client's connection pool is bound to the event loop, so it is
+        # created per call and shared by all requests of that call
+        async with openai.AsyncOpenAI(api_key=openai.api_key) as client:
+            return await self._agather_segments(
+                partial(self._agenerate_segment_audio, client), segments
+            )
+
+    async def _agenerate_segment_audio(
+        self, client: openai.AsyncOpenAI, segment: SpeakerSegment
+    ) -> SpeakerSegment:
+        """Generate audio for a single SpeakerSegment."""
+        logger.info(
+            f"Generating audio for Speaker {segment.speaker_id}: {segment.text}"
+        )
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = AudioCache.make_key(
+                "openai",
+                self.model,
+                segment.voice_config.voice,
+                segment.text,
+                self.speed,
+                self.audio_format,
             )
-            try:
-                response = openai.audio.speech.create(
-                    model=self.model,
-                    voice=segment.voice_config.voice,
-                    input=segment.text,
-                    audio_format=self.audio_format,
-                    speed=self.speed,
-                    language=self.language,
-                    stream=self.streaming,
-                )
+            cached_audio = self.cache.get(cache_key, self.audio_format)
+            if cached_audio is not None:
+                segment.audio = cached_audio
+                return segment
 
+        try:
+            async with client.audio.speech.with_streaming_response.create(
+                model=self.model,
+                voice=segment.voice_config.voice,
+                input=segment.text,
+                response_format=self.audio_format,
+                speed=self.speed,
+            ) as response:
                 if self.streaming:
                     logger.info("Streaming audio in real-time...")
-                    segment.audio = b"".join(chunk for chunk in response)
+                    audio = bytearray()
+                    async for chunk in response.iter_bytes():
+                        audio += chunk
+                    segment.audio = bytes(audio)
                 else:
                     logger.info("Saving audio to memory...")
-                    segment.audio = response.content
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate audio for Speaker {segment.speaker_id}: {str(e)}"
-                )
-                raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
-        return segments
+                    segment.audio = await response.read()
+
+        except Exception as e:
+            logger.error(
+                f"Failed to generate audio for Speaker {segment.speaker_id}: {str(e)}"
+            )
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+
+        if cache_key is not None:
+            self.cache.put(cache_key, self.audio_format, audio=segment.audio)
+        return segment